@@ -34,7 +34,9 @@ setup_kwargs = dict(
         "argh>=0.26.2",
         "prettytable>=0.7.2",
         "solana>=0.19.0",
-        "asyncit>=0.0.4"
+        "asyncit>=0.0.4",
+        "orjson>=3.6.0",
+        "msgpack>=1.0.0",
     ],
     python_requires=">=3.7",
 )
@@ -1,11 +1,34 @@
 import sys
+from typing import TYPE_CHECKING
+from importlib import import_module
 
-from .scan import Scan
-from .context import Context
 from .version import __version__
-from .nft_client import NFTClient
-from .sol_client import SOLClient
-from .token_client import TokenClient
 
 if sys.version_info < (3, 7):
     raise EnvironmentError("Python 3.7 or above is required.")
+
+if TYPE_CHECKING:
+    from .scan import Scan
+    from .context import Context
+    from .nft_client import NFTClient
+    from .sol_client import SOLClient
+    from .token_client import TokenClient
+
+# the clients are imported on first access, so using one of them doesn't load the (spl, arweave, ...) deps of the others
+LAZY_IMPORTS = {
+    "Scan": ".scan",
+    "Context": ".context",
+    "NFTClient": ".nft_client",
+    "SOLClient": ".sol_client",
+    "TokenClient": ".token_client",
+}
+
+__all__ = ["__version__", *LAZY_IMPORTS]
+
+
+def __getattr__(name):
+    if name not in LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -2,15 +2,17 @@ import os
 import json
 import time
 import logging
-from typing import Optional
+import threading
+from typing import Any, Optional
 from pathlib import Path
 from functools import partial
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from solana.account import Account
 from solana.keypair import Keypair
-from solana.rpc.api import Client
 from solana.rpc.commitment import COMMITMENT_RANKS, Confirmed, Finalized, Commitment
 
+from .utils.session import create_client
 from .utils.config_parser import ConfigParser
 
 logger = logging.getLogger("solen")
@@ -28,6 +30,10 @@ class Context:  # pylint: disable=too-many-instance-attributes
 
     >>> from solen import Context
     >>> context = Context("dev")
+
+    Used as a context manager, the threads it starts are stopped on exit:
+    >>> with Context("dev") as context:
+    >>>     token_client = TokenClient(context=context)
     """
 
     def __init__(self, env: Optional[str] = None):
@@ -39,7 +45,12 @@ class Context:  # pylint: disable=too-many-instance-attributes
         self.account = None
         self.keypair_file = None
         self.rpc_endpoint = None
+        self.ws_endpoint = None
+        self.read_clients = []
+        self.read_executor = None
+        self.read_executor_lock = threading.Lock()
         self.configured_token_mint = None
+        self.priority_fee = 0
         self.clock_time = time.perf_counter
         self.run_start = self.clock_time()
         self.config_folder = Path.home().joinpath(".config/solen")
@@ -49,6 +60,12 @@ class Context:  # pylint: disable=too-many-instance-attributes
         self.init(self.env)
         logger.info(f"Solana client env: {self.env} - {self.rpc_endpoint}")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @property
     def public_key(self):
         return self.keypair.public_key
@@ -60,11 +77,17 @@ class Context:  # pylint: disable=too-many-instance-attributes
         self.rpc_endpoint = self.config.endpoints.get(f"{self.env}_rpc_url")
         if not self.rpc_endpoint:
             raise Exception(f"missing `{self.env}_rpc_url` in config file (endpoints section)")
+        self.ws_endpoint = self.config.endpoints.get(f"{self.env}_ws_url") or self.rpc_endpoint.replace("http", "ws", 1)
         self.keypair_file = self.config.solana.get(f"{self.env}_keypair")
         if not self.keypair_file:
             raise Exception(f"missing `{self.env}_keypair` in config file (solana section)")
         self.set_keypair(self.keypair_file)
-        self.client = Client(self.rpc_endpoint, commitment=Confirmed)
+        self.priority_fee = int(self.config.solana.get(f"{self.env}_priority_fee") or 0)
+        self.client = create_client(self.rpc_endpoint, commitment=Confirmed)
+        read_endpoints = self.config.endpoints.get(f"{self.env}_read_rpc_urls") or ""
+        self.read_clients = [
+            create_client(url.strip(), commitment=Confirmed) for url in read_endpoints.split(",") if url.strip()
+        ]
         self.configured_token_mint = self.config.addresses.get(f"{self.env}_token")
         if not self.configured_token_mint:
             logger.warning(f"missing `{self.env}_token` in config file (addresses section)")
@@ -87,3 +110,44 @@ class Context:  # pylint: disable=too-many-instance-attributes
 
     def is_connected(self):
         return self.client.is_connected()
+
+    def race_read(self, method: str, *args, **kwargs) -> Any:
+        """Call a read-only rpc method on the main endpoint and on the `{env}_read_rpc_urls` endpoints
+        (comma separated, from the config file endpoints section) concurrently, and return the first valid response.
+        Without read endpoints, only the main endpoint is called.
+
+        :param method: The rpc client method name, for example: "get_signature_statuses".
+        :param args: Positional arguments for the method.
+        :param kwargs: Keyword arguments for the method.
+        """
+        if not self.read_clients:
+            return getattr(self.client, method)(*args, **kwargs)
+        clients = [self.client, *self.read_clients]
+        # the executor is created on the first race, most runs never use it
+        with self.read_executor_lock:
+            if not self.read_executor:
+                self.read_executor = ThreadPoolExecutor(max_workers=64)
+        pending = {self.read_executor.submit(getattr(client, method), *args, **kwargs) for client in clients}
+        response = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception():
+                    logger.debug(f"failed to {method} on one of the endpoints: {future.exception()}")
+                    continue
+                response = future.result()
+                if "error" not in response:
+                    # the slower requests are left to complete in the background
+                    return response
+        if response is None:
+            raise future.exception()  # pylint: disable=undefined-loop-variable
+        return response
+
+    def close(self):
+        """Stop the threads used for racing the read requests.
+        The HTTP connections are kept in the session shared by all the clients, so they stay open for re-use.
+        """
+        with self.read_executor_lock:
+            if self.read_executor:
+                self.read_executor.shutdown(wait=False)
+                self.read_executor = None
@@ -1,9 +1,32 @@
 from solana.publickey import PublicKey
 
 METADATA_PROGRAM_ID = PublicKey("metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s")
+COMPUTE_BUDGET_PROGRAM_ID = PublicKey("ComputeBudget111111111111111111111111111111")
+
+SOLANA_TOKEN_LIST_URL = "https://raw.githubusercontent.com/solana-labs/token-list/main/src/tokens/solana.tokenlist.json"
+TOKEN_LIST_TTL_SEC = 60 * 60
+
+LAMPORTS_PER_SOL = 10**9
 
 MAX_NAME_LENGTH = 32
 MAX_SYMBOL_LENGTH = 10
 MAX_URI_LENGTH = 200
 MAX_CREATOR_LENGTH = 34
 MAX_CREATOR_LIMIT = 5
+
+MAX_MULTIPLE_ACCOUNTS = 100
+MAX_SIGNATURE_STATUSES = 256
+
+# a blockhash is valid for ~150 slots (~60 sec), refresh it well before that
+BLOCKHASH_MAX_USES = 30
+BLOCKHASH_TTL_SEC = 20
+# when a newer blockhash is needed, it's polled at about the slot time until the returned one changes
+BLOCKHASH_REFRESH_SLEEP_SEC = 0.4
+BLOCKHASH_REFRESH_ATTEMPTS = 25
+# the signatures made with each of the last blockhashes are kept, to detect duplicates if a blockhash is fetched again
+BLOCKHASH_SIGNATURES_KEPT = 8
+
+# compute units limit of a token transfer transaction, with and without creating the recipient associated account.
+# set along with the priority fee, which is paid per requested compute unit
+TRANSFER_COMPUTE_UNITS = 10_000
+TRANSFER_WITH_CREATE_COMPUTE_UNITS = 60_000
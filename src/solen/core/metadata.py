@@ -3,6 +3,7 @@ import struct
 import logging
 from enum import IntEnum
 from typing import Union
+from functools import lru_cache
 
 import base58
 from construct import Flag, Bytes, Int8ul
@@ -14,10 +15,19 @@ from spl.token.constants import TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
 from solana.system_program import SYS_PROGRAM_ID as SYSTEM_PROGRAM_ID
 
 from .constants import METADATA_PROGRAM_ID
+from .public_key import get_public_key
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=65536)
+def derive_metadata_address(mint_key: str, *seeds: bytes) -> PublicKey:
+    """Derive the metadata program address of a mint, cached since the program address derivation is costly."""
+    return PublicKey.find_program_address(
+        [b"metadata", bytes(METADATA_PROGRAM_ID), bytes(get_public_key(mint_key)), *seeds], METADATA_PROGRAM_ID
+    )[0]
+
+
 class InstructionType(IntEnum):
     CREATE_METADATA = 0
     UPDATE_METADATA = 1
@@ -138,15 +148,11 @@ class Metadata:
 
     def get_metadata_account(self, mint_key: str) -> PublicKey:
         """Get program address"""
-        return PublicKey.find_program_address(
-            [b"metadata", bytes(METADATA_PROGRAM_ID), bytes(PublicKey(mint_key))], METADATA_PROGRAM_ID
-        )[0]
+        return derive_metadata_address(str(mint_key))
 
     def mint_authority(self, mint_key: str) -> PublicKey:
         """Get the Mint Authority of the token"""
-        return PublicKey.find_program_address(
-            [b"metadata", bytes(METADATA_PROGRAM_ID), bytes(PublicKey(mint_key)), b"edition"], METADATA_PROGRAM_ID
-        )[0]
+        return derive_metadata_address(str(mint_key), b"edition")
 
     def create_associated_token_account_instruction(
         self, associated_token_account, payer, wallet_address, token_mint_address
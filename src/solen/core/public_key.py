@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+from solana.publickey import PublicKey
+
+
+@lru_cache(maxsize=65536)
+def get_public_key(address: str) -> PublicKey:
+    """Get the PublicKey of a given address, cached to avoid base58 decoding the same address on each call."""
+    return PublicKey(address)
+
+
+def is_valid_address(address: str) -> bool:
+    """Returns true if the given address is a valid base58 public key."""
+    try:
+        get_public_key(address)
+    except ValueError:
+        return False
+    return True
@@ -11,7 +11,6 @@ from construct import Struct as cStruct  # type: ignore
 from asyncit.dicts import DotDict
 from solana.sysvar import SYSVAR_RENT_PUBKEY
 from solana.keypair import Keypair
-from solana.rpc.api import Client
 from solana.rpc.core import RPCException
 from solana.publickey import PublicKey
 from solana.rpc.types import TxOpts
@@ -31,6 +30,7 @@ from spl.token.instructions import initialize_mint, get_associated_token_address
 
 from .metadata import Metadata, InstructionType
 from .constants import METADATA_PROGRAM_ID
+from ..utils.session import create_client
 
 logger = logging.getLogger(__name__)
 
@@ -140,7 +140,7 @@ class Transactions:
         target=20,
         finalized=True,
     ) -> DotDict:
-        client = Client(api_endpoint)
+        client = create_client(api_endpoint)
         signers = list(map(Keypair, set(map(lambda s: s.seed, signers))))
         for attempt in range(1, max_retries + 1):
             try:
@@ -172,7 +172,7 @@ class Transactions:
         logger.info(f"going to wait {max_timeout} sec for confirmations")
         signatures = signatures if isinstance(signatures, list) else [signatures]
         run_start = time.perf_counter()
-        sleep_time = 1
+        sleep_time = 0.2
         while time.perf_counter() - run_start < max_timeout:
             elapsed = int(time.perf_counter() - run_start)
             resp = client.get_signature_statuses(signatures, search_transaction_history=True)
@@ -194,6 +194,7 @@ class Transactions:
                     logger.info(f"Took {elapsed} seconds to confirm transaction")
                     return True
             time.sleep(sleep_time)
+            sleep_time = min(2.0, sleep_time * 1.5)
         logger.error("timeout occurred on waiting for transaction")
         return False
 
@@ -218,7 +219,7 @@ class Transactions:
             If None (default), then the minimum rent exemption balance is transferred.
         """
         # Connect to the api_endpoint
-        client = Client(api_endpoint)
+        client = create_client(api_endpoint)
         # List accounts
         dest_account = PublicKey(to)
         # List signers
@@ -248,7 +249,7 @@ class Transactions:
         :param api_endpoint: (str) The RPC endpoint to connect the network. (devnet, mainnet)
         """
         # Initalize Client
-        client = Client(api_endpoint)
+        client = create_client(api_endpoint)
         # List non-derived accounts
         mint_account = Keypair()
         token_account = TOKEN_PROGRAM_ID
@@ -299,7 +300,7 @@ class Transactions:
         Return a status flag of success or fail and the native transaction data.
         """
         # Initialize Client
-        client = Client(api_endpoint)
+        client = create_client(api_endpoint)
         # List non-derived accounts
         mint_account = PublicKey(contract_key)
         user_account = PublicKey(dest_key)
@@ -380,7 +381,7 @@ class Transactions:
         :param private_key: The encrypted private key of the sender.
         """
         # Initialize Client
-        client = Client(api_endpoint)
+        client = create_client(api_endpoint)
         # List non-derived accounts
         owner_account = Keypair(private_key)  # Owner of contract
         sender_account = PublicKey(sender_key)  # Public key of `owner_account`
@@ -436,7 +437,7 @@ class Transactions:
         :param private_key: The encrypted private key of the owner
         """
         # Initialize Client
-        client = Client(api_endpoint)
+        client = create_client(api_endpoint)
         # List accounts
         owner_account = PublicKey(owner_key)
         token_account = TOKEN_PROGRAM_ID
@@ -473,6 +474,7 @@ class Transactions:
             return date.replace(hour=0, minute=0, second=0, microsecond=0)
 
         def add_sum_data(data: DotDict) -> DotDict:
+            meta = data["meta"]
             data = DotDict(data)
             data["sum"] = DotDict(signature=signature)
             timestamp = data.get("blockTime")
@@ -483,35 +485,39 @@ class Transactions:
                                                     round_date(datetime.fromtimestamp(timestamp))).days
             elapsed_time = datetime.today() - datetime.fromtimestamp(timestamp)
             data["sum"]["elapsed_time"] = str(elapsed_time).split(".", maxsplit=1)[0]
-            if len(data.meta.preTokenBalances) > 0:
+            pre_token_balances = meta.get("preTokenBalances") or []
+            if pre_token_balances:
+                post_token_balances = meta.get("postTokenBalances") or []
                 try:
-                    amount_before = float(data.meta.preTokenBalances[1]["uiTokenAmount"]["uiAmountString"])
-                    amount_after = float(data.meta.postTokenBalances[1]["uiTokenAmount"]["uiAmountString"])
-                    token_decimals = int(data.meta.postTokenBalances[1]["uiTokenAmount"]["decimals"])
+                    amount_before = float(pre_token_balances[1]["uiTokenAmount"]["uiAmountString"])
+                    amount_after = float(post_token_balances[1]["uiTokenAmount"]["uiAmountString"])
+                    token_decimals = int(post_token_balances[1]["uiTokenAmount"]["decimals"])
                     transfer_amount = round(float(amount_after - amount_before), token_decimals)
                 except Exception:
                     logger.warning(f"failed to get amount for transaction")
                     amount_before = amount_after = transfer_amount = None
                 data["sum"]["type"] = "transfer"
                 data["sum"]["transfer"] = DotDict({
-                    "token": data.meta.preTokenBalances[0]['mint'],
-                    "from": data.meta.preTokenBalances[0]["owner"],
-                    "to": data.meta.preTokenBalances[1]["owner"],
+                    "token": pre_token_balances[0]['mint'],
+                    "from": pre_token_balances[0]["owner"],
+                    "to": pre_token_balances[1]["owner"],
                     "amount_before": amount_before,
                     "amount_after": amount_after,
                     "change_amount": transfer_amount
                 })
             return data
 
-        client = Client(api_endpoint)
-        transaction = DotDict(client.get_transaction(signature))
-        if transaction.error:
+        client = create_client(api_endpoint)
+        transaction = client.get_transaction(signature)
+        if transaction.get("error"):
             logger.error(f"failed to get transaction data for {signature}")
-            return DotDict(ok=False, err=transaction.error.message)
-        if not transaction["result"]:
+            return DotDict(ok=False, err=transaction["error"].get("message"))
+        if not transaction.get("result"):
             logger.error(f"failed to get transaction data for {signature}")
             return DotDict(ok=False)
+        # work on the raw meta dict, DotDict copies a nested dict on each attribute access
+        meta = transaction["result"]["meta"]
         data = add_sum_data(transaction["result"])
-        if len(data.meta.preTokenBalances) > 0:
-            logger.info(f"it is a {data.meta.preTokenBalances[0]['mint']} transfer transaction")
+        if meta.get("preTokenBalances"):
+            logger.info(f"it is a {meta['preTokenBalances'][0]['mint']} transfer transaction")
         return DotDict(ok=True, data=data)
@@ -1,5 +1,4 @@
 import os
-import json
 import time
 import base64
 import struct
@@ -9,7 +8,6 @@ from datetime import datetime, timedelta
 from collections import Counter
 
 import base58
-import requests
 from asyncit import Asyncit
 from asyncit.dicts import DotDict
 from solana.publickey import PublicKey
@@ -23,8 +21,11 @@ from .context import Context
 from .core.api import API
 from .core.errors import token_metadata_errors
 from .token_client import TokenClient
+from .utils.jsonio import json_loads
 from .core.metadata import Metadata
 from .utils.arweave import Arweave
+from .utils.session import get_session
+from .core.constants import LAMPORTS_PER_SOL
 from .core.transactions import Transactions
 from .utils.bulk_handler import BulkHandler
 
@@ -64,6 +65,8 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
             self.bulk_sum_info,
             "update",
             ["mint_address"],
+            ws_endpoint=self.context.ws_endpoint,
+            read_callback=self.context.race_read,
         )
         self.metadata = Metadata()
         self.transaction = Transactions()
@@ -156,11 +159,11 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
         if not on_chain_data.ok:
             return response.update(ok=False, err="failed to get data")
         on_chain_data = on_chain_data.data
-        response_uri = requests.get(on_chain_data.data.uri)
+        response_uri = get_session().get(on_chain_data.data.uri, timeout=30)
         if response_uri.status_code != 200:
             logger.error(f"failed to get uri: {on_chain_data.data.uri}, status: {response_uri.status_code}")
             return response.update(ok=False)
-        data = DotDict(json.loads(response_uri.content.decode("utf-8")))
+        data = DotDict(json_loads(response_uri.content))
         if prettify_traits:
             traits = DotDict({})
             for attr in data.attributes:
@@ -316,7 +319,7 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
     def _parse_token_value(self, value: Dict) -> Dict:
         """Parse extract meaningful dict data from the extended token account data."""
         associate_account_pubkey = value["pubkey"]
-        sol_balance = value["account"]["lamports"] / pow(10, 9)
+        sol_balance = value["account"]["lamports"] / LAMPORTS_PER_SOL
         info = value["account"]["data"]["parsed"]["info"]
         token_address = info["mint"]
         update_authority = info["owner"]
@@ -544,7 +547,7 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
             return response.update(signature=transaction_signature, ok=True, time=self._elapsed_time(run_start))
         logger.info(f"going to verify update transaction signature: {transaction_signature}")
         transactions = Transactions()
-        transaction_data = DotDict(transactions.get_transaction_data(self.context.rpc_endpoint, transaction_signature))
+        transaction_data = transactions.get_transaction_data(self.context.rpc_endpoint, transaction_signature)
         if not transaction_data.ok:
             return response.update(
                 signature=transaction_signature,
@@ -552,10 +555,12 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
                 ok=False,
                 time=self._elapsed_time(run_start),
             )
-        if transaction_data.data.meta.err or transaction_data.data.meta.status.Err:
-            logger.error("\n".join(transaction_data.data.meta.logMessages))
+        meta = transaction_data.data.meta
+        if meta.err or meta.status.Err:
+            log_messages = meta.logMessages
+            logger.error("\n".join(log_messages))
             err_code = None
-            for line in transaction_data.data.meta.logMessages:
+            for line in log_messages:
                 if "custom program error:" in line:
                     err_code = line.split(":")[-1].strip()
                     err_code = err_code.split("x")[-1]
@@ -615,7 +620,7 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
         :param csv_path: Path to a csv file in the format of: wallet,amount.
         """
         with open(csv_path, encoding="UTF-8") as f:
-            first_line = f.readlines()[0]
+            first_line = f.readline()
         columns = {i.strip() for i in first_line.split(",")}
         optional_nft_update_key = {"uri", "name", "symbol", "fee", "creators"}
         exiting_nft_update_columns = list(columns.intersection(optional_nft_update_key))
@@ -634,9 +639,14 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
         in_process = in_process or self.bulk_update_nft_handler.in_process
 
         total_items = len(in_process)
-        total_items_with_no_signature = sum(not i["signature"] for i in in_process.values())
-        items_with_signature_but_not_finalized = sum(not i["finalized"] for i in in_process.values() if i["signature"])
-        total_finalized = sum(i["finalized"] for i in in_process.values())
+        total_items_with_no_signature = items_with_signature_but_not_finalized = total_finalized = 0
+        for item in in_process.values():
+            if item["finalized"]:
+                total_finalized += 1
+            if not item["signature"]:
+                total_items_with_no_signature += 1
+            elif not item["finalized"]:
+                items_with_signature_but_not_finalized += 1
 
         if log_sum:
             logger.info(
@@ -658,6 +668,7 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
         dry_run: bool = False,
         skip_confirm: bool = False,
         ignore_unfinalized_signature: bool = False,
+        pool_size: int = 32,
     ):
         """Update multiple NFTs, based on the content of transfer_csv_path.
 
@@ -666,6 +677,7 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
         :param dry_run: When true the transactions will be skipped.
         :param skip_confirm: When true transaction confirmation will be skipped. Run will be faster but less reliable.
         :param ignore_unfinalized_signature: When true actions with un-finalized transaction will retry processing.
+        :param pool_size: Max number of actions to run concurrently.
 
         >>> from solen import NFTClient
         >>> token_client = NFTClient("dev")
@@ -676,7 +688,7 @@ class NFTClient:  # pylint: disable=too-many-instance-attributes
         Cy4y1XGR9pj7vFikWVGrdQAPWCChqV9gQHCLht6eXBLW,MQA
         """
         update_response = self.bulk_update_nft_handler.bulk_run(
-            csv_path, dry_run, skip_confirm, ignore_unfinalized_signature
+            csv_path, dry_run, skip_confirm, ignore_unfinalized_signature, pool_size
         )
         if not update_response.ok:
             logger.error(f"failed to update nfts, err: {update_response.err}")
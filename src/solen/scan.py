@@ -1,12 +1,13 @@
 import logging
-from typing import Dict
+from typing import Dict, List
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from asyncit.dicts import DotDict
-from solana.publickey import PublicKey
 
 from .context import Context
 from .nft_client import NFTClient
+from .core.public_key import get_public_key
 
 logger = logging.getLogger(__name__)
 
@@ -27,14 +28,14 @@ class Scan:
         latest_slot = response["result"]["context"]["slot"]
         block = self.client.get_block(latest_slot - bac_time)
         until_transaction = block["result"]["transactions"][0]["transaction"]["signatures"]
-        return self.client.get_confirmed_signature_for_address2(PublicKey(address), limit=limit)
+        return self.client.get_confirmed_signature_for_address2(get_public_key(address), limit=limit)
 
     def get_nft_transfers(self, mint_address):
         nft_client = NFTClient(context=self.context)
         return nft_client.get_transactions(mint_address)
 
     def get_nft_holders(self, mint_address):
-        return self.client.get_token_largest_accounts(PublicKey(mint_address))
+        return self.client.get_token_largest_accounts(get_public_key(mint_address))
 
     def get_nft_transfer_in_time_range(self):
         response = self.client.get_recent_blockhash()
@@ -43,12 +44,23 @@ class Scan:
         return latest_block_timestamp
 
     def get_nft_transfer_in_block(self, block_slot, mint_address):
-        data = []
-        transactions = self.get_block_transactions(block_slot)
-        for transaction in transactions:
-            if self.is_it_transfer_transaction_of_nft(transaction, mint_address):
-                data.append(transaction)
-        return data
+        return [
+            transaction
+            for transaction in self.get_block_transactions(block_slot)
+            if self.is_it_transfer_transaction_of_nft(transaction, mint_address)
+        ]
+
+    def get_nft_transfer_in_blocks(self, block_slots: List[int], mint_address: str, pool_size: int = 16) -> List[Dict]:
+        """Get the transfer transactions of a given NFT in multiple blocks, fetching the blocks concurrently.
+
+        :param block_slots: The blocks slots to scan.
+        :param mint_address: The NFT mint address to look for.
+        :param pool_size: Max number of blocks to fetch concurrently.
+        """
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            # map keeps the slots order, and a block that failed to be fetched raises instead of being dropped
+            blocks = executor.map(lambda slot: self.get_nft_transfer_in_block(slot, mint_address), sorted(block_slots))
+            return [transaction for transactions in blocks for transaction in transactions]
 
     def get_block_transactions(self, block_slot):
         block = self.client.get_block(block_slot)
@@ -1,12 +1,15 @@
 import os
 import json
 import logging
+from typing import Dict, List, Union, Optional
+from decimal import Decimal
 from functools import partial
 
 from asyncit.dicts import DotDict
 from solana.keypair import Keypair
 from solana.rpc.core import RPCException
 from solana.publickey import PublicKey
+from solana.rpc.types import DataSliceOpts
 from solana.transaction import Transaction
 from solana.system_program import (
     SYS_PROGRAM_ID,
@@ -18,6 +21,8 @@ from solana.system_program import (
 )
 
 from .context import Context
+from .core.constants import LAMPORTS_PER_SOL, MAX_MULTIPLE_ACCOUNTS
+from .core.public_key import is_valid_address
 from .core.transactions import Transactions
 
 logger = logging.getLogger("solen")
@@ -61,7 +66,7 @@ class SOLClient:  # pylint: disable=too-many-instance-attributes
         transaction.add(
             create_account(
                 CreateAccountParams(
-                    from_pubkey=PublicKey(self.context.keypair.public_key),
+                    from_pubkey=self.context.keypair.public_key,
                     new_account_pubkey=key.public_key,
                     lamports=self.context.client.get_minimum_balance_for_rent_exemption(88).get("result"),
                     space=88,
@@ -88,14 +93,14 @@ class SOLClient:  # pylint: disable=too-many-instance-attributes
         :param destination: Destination address to receive the SOL.
         :param amount: Amount to transfer.
         """
-        sol_decimals = 9
-        amount_lamport = int(amount * pow(10, sol_decimals))
+        # the amount string is converted as is, a float product may fall just below the exact amount (0.57 * 100)
+        amount_lamport = int(Decimal(str(amount)) * LAMPORTS_PER_SOL)
         response = DotDict(dest=destination, amount=amount, amount_lamport=amount_lamport)
         try:
             txn = Transaction().add(
                 transfer(
                     TransferParams(
-                        from_pubkey=PublicKey(self.context.keypair.public_key),
+                        from_pubkey=self.context.keypair.public_key,
                         to_pubkey=PublicKey(destination),
                         lamports=amount_lamport,
                     )
@@ -129,6 +134,31 @@ class SOLClient:  # pylint: disable=too-many-instance-attributes
             error = response["error"]
             logger.error(f"failed to get token balance. error: {error}")
             return 0
-        digits = 9
         lamport = response["result"]["value"]
-        return lamport / pow(10, digits)
+        return lamport / LAMPORTS_PER_SOL
+
+    def balance_many(self, owners: List[Union[PublicKey, str]]) -> Dict[str, Optional[float]]:
+        """Returns the SOL amount of multiple wallet addresses, using batched get_multiple_accounts requests.
+        Invalid addresses get None, addresses that failed to be fetched are not part of the result.
+
+        :param owners: The addresses to get balance for.
+
+        >>> from solen import SOLClient
+        >>> sol_client = SOLClient("main")
+        >>> sol_client.balance_many(["Cy4y1XGR9pj7vFikWVGrdQAPWCChqV9gQHCLht6eXBLW"])
+        """
+        owners = list(dict.fromkeys(str(owner) for owner in owners))
+        # an invalid address would fail the whole get_multiple_accounts request
+        balances = {owner: None for owner in owners if not is_valid_address(owner)}
+        owners = [owner for owner in owners if owner not in balances]
+        # only the lamports are needed, the accounts data is not fetched
+        data_slice = DataSliceOpts(offset=0, length=0)
+        for i in range(0, len(owners), MAX_MULTIPLE_ACCOUNTS):
+            chunk = owners[i : i + MAX_MULTIPLE_ACCOUNTS]
+            response = self.context.race_read("get_multiple_accounts", chunk, data_slice=data_slice)
+            if "error" in response:
+                logger.error(f"failed to get SOL balances. error: {response['error']}")
+                continue
+            for owner, value in zip(chunk, response["result"]["value"]):
+                balances[owner] = (value["lamports"] if value else 0) / LAMPORTS_PER_SOL
+        return balances
@@ -1,33 +1,71 @@
 import os
 import json
 import time
+import base64
+import struct
 import logging
-from typing import Dict, List, Union, Optional
+import threading
+from typing import Dict, List, Tuple, Union, Optional
+from decimal import Decimal
 from datetime import timedelta
-from functools import partial
-from collections import Counter
+from functools import partial, lru_cache
+from collections import Counter, defaultdict
 
+import base58
 import requests
 import spl.token.instructions as spl_token
 from asyncit.dicts import DotDict
 from solana.rpc.api import MemcmpOpt
 from solana.rpc.core import RPCException, UnconfirmedTxError
 from solana.publickey import PublicKey
-from solana.rpc.types import TxOpts
+from solana.rpc.types import TxOpts, DataSliceOpts
 from spl.token.client import Token
-from solana.transaction import Transaction
+from solana.transaction import AccountMeta, Transaction, TransactionInstruction
 from spl.token.constants import TOKEN_PROGRAM_ID
-from solana.rpc.commitment import Confirmed, Commitment
+from solana.rpc.commitment import Confirmed, Finalized, Commitment
 from spl.token.instructions import TransferCheckedParams, transfer_checked
 
 from .context import Context
 from .response import Ok, Err, Response
+from .utils.jsonio import dump_json, json_loads
+from .utils.session import get_session
+from .core.constants import (
+    BLOCKHASH_TTL_SEC,
+    BLOCKHASH_MAX_USES,
+    TOKEN_LIST_TTL_SEC,
+    MAX_MULTIPLE_ACCOUNTS,
+    SOLANA_TOKEN_LIST_URL,
+    TRANSFER_COMPUTE_UNITS,
+    BLOCKHASH_SIGNATURES_KEPT,
+    COMPUTE_BUDGET_PROGRAM_ID,
+    BLOCKHASH_REFRESH_ATTEMPTS,
+    BLOCKHASH_REFRESH_SLEEP_SEC,
+    TRANSFER_WITH_CREATE_COMPUTE_UNITS,
+)
+from .core.public_key import get_public_key, is_valid_address
 from .core.transactions import Transactions
-from .utils.bulk_handler import BulkHandler
+from .utils.bulk_handler import BLOCKHASH_NOT_FOUND, BulkHandler
 
 logger = logging.getLogger(__name__)
 open_utf8 = partial(open, encoding="UTF-8")
 
+DEST_TOKEN_ACCOUNT = "token_account"
+DEST_ASSOCIATED_EXISTS = "associated_exists"
+DEST_NEEDS_CREATE = "needs_create"
+
+TRANSFER_CHECKED_INSTRUCTION = 12
+CREATE_IDEMPOTENT_INSTRUCTION = 1
+TOKEN_ACCOUNT_OWNER_OFFSET = 32
+TOKEN_ACCOUNT_AMOUNT_OFFSET = 64
+SET_COMPUTE_UNIT_LIMIT_INSTRUCTION = 2
+SET_COMPUTE_UNIT_PRICE_INSTRUCTION = 3
+
+
+@lru_cache(maxsize=65536)
+def derive_associated_address(owner: str, token: str) -> PublicKey:
+    """Derive the associated token address of an owner, cached since the program address derivation is costly."""
+    return spl_token.get_associated_token_address(get_public_key(owner), get_public_key(token))
+
 
 class TokenClient:  # pylint: disable=too-many-instance-attributes
     """Token Client class.
@@ -60,18 +98,57 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
             self.bulk_sum_info,
             "transfer",
             ["dest", "amount"],
+            prepare_callback=self.prepare_bulk_transfer,
+            ws_endpoint=self.context.ws_endpoint,
+            read_callback=self.context.race_read,
         )
         self.token_mint = token_mint or self.context.configured_token_mint
         self.clock_time = time.perf_counter
         self.run_start = self.clock_time()
-        self.token = Token(self.client, PublicKey(self.token_mint), TOKEN_PROGRAM_ID, self.keypair)
-        self.token_decimals = self.get_token_decimals()
+        self.token_mint_public_key = PublicKey(self.token_mint)
+        self.token = Token(self.client, self.token_mint_public_key, TOKEN_PROGRAM_ID, self.keypair)
+        self.decimals_cache_file = self.config_folder.joinpath(f"{self.env}_mint_decimals.json")
+        self.decimals_cache = self.load_decimals_cache()
+        self.decimals_cache_lock = threading.Lock()
+        self.token_list = None
+        self.token_list_index = {}
+        self.token_list_time = 0
+        self.source_associated_address = self.get_associated_address(self.keypair.public_key, self.token_mint)
+        self.resolved_destinations = {}
+        self.priority_fee = self.context.priority_fee
+        # the dest, amount and decimals are placeholders, set per transfer by _get_transfer_instruction
+        self.transfer_instruction_template = transfer_checked(
+            TransferCheckedParams(
+                program_id=TOKEN_PROGRAM_ID,
+                source=self.source_associated_address,
+                mint=self.token_mint_public_key,
+                dest=self.source_associated_address,
+                owner=self.keypair.public_key,
+                amount=0,
+                decimals=0,
+                signers=[],
+            )
+        )
+        self.recent_blockhash = None
+        self.recent_blockhash_uses = 0
+        self.recent_blockhash_time = 0
+        self.recent_blockhash_signatures = {}
+        self.recent_blockhash_lock = threading.Lock()
         os.makedirs(self.transfers_data_folder, exist_ok=True)
 
     @property
     def env(self):
         return self.context.env
 
+    @property
+    def token_decimals(self) -> int:
+        """The configured token decimals, fetched on first use (and cached by get_token_decimals)."""
+        return self.get_token_decimals()
+
+    @property
+    def lamport_multiplier(self) -> int:
+        return 10**self.token_decimals
+
     def _set_start_time(self):
         self.run_start = self.clock_time()
 
@@ -102,19 +179,67 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
             logger.error(f"got invalid filter: {list(kwargs.keys())}. Look at docs for valid options")
             return []
         filter_key, filter_value = list(kwargs.items())[0]
-        solana_tokens = "https://raw.githubusercontent.com/solana-labs/token-list/main/src/tokens/solana.tokenlist.json"
-        response = requests.get(solana_tokens)
-        if response.status_code != 200:
+        self.get_token_list()
+        if filter_key == "tags":
+            filter_value = str(filter_value).upper()
+        return [DotDict(i) for i in self.token_list_index[filter_key].get(filter_value, [])]
+
+    def get_token_list(self) -> List[Dict]:
+        """Return the Solana registered tokens list.
+
+        The list is cached in the config folder, and downloaded again only when its ETag been changed.
+        Both the cache file and the parsed list are used for TOKEN_LIST_TTL_SEC seconds before checking for changes.
+        """
+        if self.token_list and self.clock_time() - self.token_list_time < TOKEN_LIST_TTL_SEC:
+            return self.token_list
+        self.token_list = self._load_token_list()
+        self.token_list_time = self.clock_time()
+        self.token_list_index = self._index_token_list(self.token_list)
+        return self.token_list
+
+    @staticmethod
+    def _index_token_list(tokens: List[Dict]) -> Dict[str, Dict]:
+        """Index the tokens by address, symbol, name and (upper case) tags, for the get_registered_info filters.
+
+        :param tokens: The Solana registered tokens list.
+        """
+        index = {key: defaultdict(list) for key in ("address", "symbol", "name", "tags")}
+        for token in tokens:
+            for key in ("address", "symbol", "name"):
+                index[key][token.get(key)].append(token)
+            for tag in {str(tag).upper() for tag in token.get("tags", ()) if tag}:
+                index["tags"][tag].append(token)
+        return index
+
+    def _load_token_list(self) -> List[Dict]:
+        """Load the token list from the cache file, downloading it first in case its ETag been changed."""
+        token_list_file = self.config_folder.joinpath(SOLANA_TOKEN_LIST_URL.rsplit("/", maxsplit=1)[-1])
+        etag_file = token_list_file.with_suffix(".etag")
+        if token_list_file.exists() and time.time() - token_list_file.stat().st_mtime < TOKEN_LIST_TTL_SEC:
+            return json_loads(token_list_file.read_bytes())["tokens"]
+        headers = {}
+        if token_list_file.exists() and etag_file.exists():
+            headers["If-None-Match"] = etag_file.read_text(encoding="utf-8")
+        try:
+            response = get_session().get(SOLANA_TOKEN_LIST_URL, headers=headers, timeout=30)
+        except requests.RequestException as ex:
+            logger.error(f"failed to get token list. error: {ex}")
+            response = None
+        if response is not None and response.status_code == 200:
+            tmp_file = token_list_file.with_suffix(".tmp")
+            tmp_file.write_bytes(response.content)
+            os.replace(tmp_file, token_list_file)
+            if response.headers.get("ETag"):
+                etag_file.write_text(response.headers["ETag"], encoding="utf-8")
+            return json_loads(response.content)["tokens"]
+        if response is not None and response.status_code != 304:
+            logger.error(f"failed to get token list. status code: {response.status_code}")
+        if not token_list_file.exists():
             return []
-        tokens = json.loads(response.content)["tokens"]
-        result = []
-        for token_info in tokens:
-            if filter_key == "tags":
-                if str(filter_value.upper()) in [str(v.upper()) for v in token_info.get(filter_key, []) if v]:
-                    result.append(DotDict(token_info))
-            elif token_info.get(filter_key, None) == filter_value:
-                result.append(DotDict(token_info))
-        return result
+        if response is not None and response.status_code == 304:
+            # the cached list is up to date, the next check is TOKEN_LIST_TTL_SEC seconds from now
+            token_list_file.touch()
+        return json_loads(token_list_file.read_bytes())["tokens"]
 
     def get_token_decimals(self, pubkey: Optional[Union[PublicKey, str]] = None) -> int:
         """Returns the decimal config of an SPL Token type. (default is the configured token)
@@ -125,11 +250,29 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         >>> token_client = TokenClient("dev")
         >>> token_client.get_token_decimals()
         """
+        mint = str(pubkey or self.token_mint)
+        if mint in self.decimals_cache:
+            return self.decimals_cache[mint]
         if pubkey:
-            response = self.client.get_token_supply(str(pubkey), commitment=Confirmed)
-            return response["result"]["value"]["decimals"]
-        info = self.token.get_mint_info()
-        return info.decimals
+            response = self.client.get_token_supply(mint, commitment=Confirmed)
+            decimals = response["result"]["value"]["decimals"]
+        else:
+            decimals = self.token.get_mint_info().decimals
+        # a mint decimals can't be changed, no need to ever refresh it
+        with self.decimals_cache_lock:
+            self.decimals_cache[mint] = decimals
+            dump_json(self.decimals_cache_file, self.decimals_cache)
+        return decimals
+
+    def load_decimals_cache(self) -> Dict[str, int]:
+        """Load the mint decimals that been saved in the config folder by previous runs."""
+        if not self.decimals_cache_file.exists():
+            return {}
+        try:
+            return json.loads(self.decimals_cache_file.read_text(encoding="utf-8"))
+        except ValueError as ex:
+            logger.warning(f"failed to load mint decimals cache file: {self.decimals_cache_file}, ex: {ex}")
+            return {}
 
     def balance(self, owner: Optional[Union[PublicKey, str]] = None) -> int:
         """Returns the token balance for the given dest address. (default is keypair address)
@@ -156,6 +299,34 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
             logger.error(f"failed to retrieve balance.. error: {ex}")
             return 0
 
+    def balance_many(self, owners: List[Union[PublicKey, str]]) -> Dict[str, Optional[float]]:
+        """Returns the token balance of multiple addresses, using batched get_multiple_accounts requests.
+        Addresses without a token account get 0, invalid addresses get None,
+        addresses that failed to be fetched are not part of the result.
+
+        :param owners: The addresses that need to query for token balance.
+
+        >>> from solen import TokenClient
+        >>> token_client = TokenClient("dev")
+        >>> token_client.balance_many(["Cy4y1XGR9pj7vFikWVGrdQAPWCChqV9gQHCLht6eXBLW"])
+        """
+        owners = list(dict.fromkeys(str(owner) for owner in owners))
+        balances = {owner: None for owner in owners if not is_valid_address(owner)}
+        owners = [owner for owner in owners if owner not in balances]
+        addresses = [str(self.get_associated_address(owner, self.token_mint)) for owner in owners]
+        # only the amount of the token account layout is fetched (mint, owner, amount, ...)
+        data_slice = DataSliceOpts(offset=TOKEN_ACCOUNT_AMOUNT_OFFSET, length=8)
+        for i in range(0, len(addresses), MAX_MULTIPLE_ACCOUNTS):
+            chunk = addresses[i : i + MAX_MULTIPLE_ACCOUNTS]
+            response = self.context.race_read("get_multiple_accounts", chunk, data_slice=data_slice)
+            if "error" in response:
+                logger.error(f"failed to retrieve token balances. error: {response['error']}")
+                continue
+            for owner, value in zip(owners[i : i + MAX_MULTIPLE_ACCOUNTS], response["result"]["value"]):
+                amount = struct.unpack("<Q", base64.b64decode(value["data"][0]))[0] if value else 0
+                balances[owner] = amount / self.lamport_multiplier
+        return balances
+
     def get_associated_address(self, owner: str = None, token: Optional[str] = None) -> PublicKey:
         """Derives the associated token address for the given dest address and token mint.
 
@@ -164,7 +335,7 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         """
         owner = owner or self.keypair.public_key
         token = token or self.token_mint
-        return spl_token.get_associated_token_address(PublicKey(owner), PublicKey(token))
+        return derive_associated_address(str(owner), str(token))
 
     def is_it_token_account(self, address: str) -> bool:
         """Returns true if the given address is a token associate account.
@@ -182,6 +353,69 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         response = self.client.get_account_info(address)
         return response["result"]["value"] is not None
 
+    def _get_destination_status(self, dest: str) -> Tuple[str, PublicKey]:
+        """Return the destination status and the address that should receive the token.
+
+        :param dest: Recipient address.
+        """
+        resolved = self._resolve_destinations([dest])
+        if dest in resolved:
+            return resolved[dest]
+        # fallback to separate account info requests
+        if self.is_it_token_account(dest):
+            return DEST_TOKEN_ACCOUNT, get_public_key(dest)
+        dest_token_address = self.get_associated_address(dest)
+        if self.is_account_funded(str(dest_token_address)):
+            return DEST_ASSOCIATED_EXISTS, dest_token_address
+        return DEST_NEEDS_CREATE, dest_token_address
+
+    def _resolve_destinations(self, destinations: List[str]) -> Dict[str, Tuple[str, PublicKey]]:
+        """Resolve the status of multiple destinations, using batched get_multiple_accounts requests.
+
+        :param destinations: Recipient addresses.
+
+        The result maps each destination to a tuple of (status, address that should receive the token).
+        Destinations that failed to be resolved are not part of the result.
+        """
+        pairs = []
+        for dest in dict.fromkeys(destinations):
+            try:
+                pairs.append((dest, self.get_associated_address(dest)))
+            except Exception as ex:
+                logger.warning(f"failed to get associated address for: {dest}, ex: {ex}")
+        addresses = [str(address) for pair in pairs for address in pair]
+        data_slice = DataSliceOpts(offset=0, length=0)
+        accounts_info = []
+        for i in range(0, len(addresses), MAX_MULTIPLE_ACCOUNTS):
+            chunk = addresses[i : i + MAX_MULTIPLE_ACCOUNTS]
+            response = self.context.race_read("get_multiple_accounts", chunk, data_slice=data_slice)
+            if "error" in response:
+                logger.error(f"failed to get multiple accounts info. error: {response['error']}")
+                accounts_info.extend([False] * len(chunk))
+                continue
+            accounts_info.extend(response["result"]["value"])
+        result = {}
+        for i, (dest, dest_token_address) in enumerate(pairs):
+            dest_info, associated_info = accounts_info[2 * i], accounts_info[2 * i + 1]
+            if dest_info is False or associated_info is False:
+                continue
+            if dest_info and dest_info["owner"] == str(TOKEN_PROGRAM_ID):
+                result[dest] = (DEST_TOKEN_ACCOUNT, get_public_key(dest))
+            elif associated_info:
+                result[dest] = (DEST_ASSOCIATED_EXISTS, dest_token_address)
+            else:
+                result[dest] = (DEST_NEEDS_CREATE, dest_token_address)
+        return result
+
+    def prepare_bulk_transfer(self, items: List[Dict]):
+        """Resolve the destinations of the pending bulk transfer items in advance.
+
+        :param items: The in-process items that are going to be transferred.
+        """
+        destinations = [item["dest"] for item in items]
+        logger.info(f"going to resolve {len(destinations)} destinations")
+        self.resolved_destinations.update(self._resolve_destinations(destinations))
+
     def transfer_token(
         self,
         dest: str,
@@ -189,6 +423,8 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         dry_run: bool = False,
         skip_confirmation: bool = False,
         commitment: Commitment = Confirmed,
+        priority_fee: Optional[int] = None,
+        skip_preflight: bool = False,
     ) -> Dict:
         """Generate an instruction that transfers amount of configured token from one self account to another.
 
@@ -197,61 +433,165 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         :param dry_run: If true the transfer will not be executed.
         :param skip_confirmation: If true send transfer will not be confirmed. It might be faster.
         :param commitment: The commitment type for send transfer.
+        :param priority_fee: Compute unit price in micro lamports, to prioritize the transaction in times of congestion.
+            (default taken from the `{env}_priority_fee` config, no priority fee when 0)
+        :param skip_preflight: If true the transaction is sent without the rpc node simulating it first.
+            A transaction that would fail is then only detected by its error, when confirmed. (default is false)
 
         >>> from solen import TokenClient
         >>> from solana.rpc.commitment import Processed
         >>> token_client = TokenClient("dev")
         >>> token_client.transfer_token("Cy4y1XGR9pj7vFikWVGrdQAPWCChqV9gQHCLht6eXBLW", 0.01, True, Processed)
         """
+        # the csv amount string is converted as is, a float product may fall just below the exact amount (0.57 * 100)
+        amount_lamport = int(Decimal(str(amount)) * self.lamport_multiplier)
         amount = float(amount)
         token = self.token_mint
-        decimals = self.token_decimals
         run_start = self.clock_time()
         response = DotDict(token=token, dest=dest, amount=amount, confirmed=False, signature="")
-        amount_lamport = int(amount * pow(10, self.token_decimals))
         logger.info(f"going to transfer {amount} ({amount_lamport} lamport) from local wallet to {dest}")
         if dry_run:
             return response.update(signature="test-run", ok=True, time=self._elapsed_time(run_start))
-        if not self.is_it_token_account(dest):
-            dest_token_address = str(self.get_associated_address(dest))
-            logger.info(f"recipient associated token account: {dest_token_address}")
-            if not self.is_account_funded(dest_token_address):
-                logger.info(f"create & fund recipient associated token account: {dest_token_address}")
-                create_associate_account_response = self.create_associated_token_account(dest)
-                if create_associate_account_response.err:
-                    err_msg = "failed to transfer token (failed to create associated token account)"
-                    logger.error(err_msg)
-                    return response.update(err=err_msg, ok=False, time=self._elapsed_time(run_start))
-            dest = dest_token_address
         transaction = Transaction()
+        priority_fee = self.priority_fee if priority_fee is None else priority_fee
         try:
-            transaction.add(
-                transfer_checked(
-                    TransferCheckedParams(
-                        program_id=TOKEN_PROGRAM_ID,
-                        source=self.get_associated_address(self.keypair.public_key, token),
-                        mint=PublicKey(token),
-                        dest=PublicKey(dest),
-                        owner=self.keypair.public_key,
-                        amount=amount_lamport,
-                        decimals=decimals,
-                        signers=[],
-                    )
-                )
+            if dest in self.resolved_destinations:
+                dest_status, dest_token_address = self.resolved_destinations[dest]
+            else:
+                dest_status, dest_token_address = self._get_destination_status(dest)
+                self.resolved_destinations[dest] = (dest_status, dest_token_address)
+            if dest_status != DEST_TOKEN_ACCOUNT:
+                logger.info(f"recipient associated token account: {dest_token_address}")
+            if priority_fee:
+                compute_units = TRANSFER_COMPUTE_UNITS
+                if dest_status == DEST_NEEDS_CREATE:
+                    compute_units = TRANSFER_WITH_CREATE_COMPUTE_UNITS
+                transaction.add(*self._get_compute_budget_instructions(compute_units, priority_fee))
+            if dest_status == DEST_NEEDS_CREATE:
+                logger.info(f"create & fund recipient associated token account: {dest_token_address}")
+                transaction.add(self._get_create_associated_account_instruction(get_public_key(dest)))
+            transaction.add(self._get_transfer_instruction(dest_token_address, amount_lamport))
+            options = TxOpts(
+                skip_confirmation=skip_confirmation, skip_preflight=skip_preflight, preflight_commitment=commitment
             )
-            options = TxOpts(skip_confirmation=skip_confirmation, preflight_commitment=commitment)
-            send_transaction_response = self.client.send_transaction(transaction, self.keypair, opts=options)
+            self.sign_transaction(transaction)
+            send_transaction_response = self.client.send_raw_transaction(transaction.serialize(), opts=options)
             trn_sig = send_transaction_response["result"]
             logger.info(f"token been transferred, transaction signature: {trn_sig}")
+            if dest_status == DEST_NEEDS_CREATE:
+                self.resolved_destinations[dest] = (DEST_ASSOCIATED_EXISTS, dest_token_address)
             return response.update(signature=trn_sig, ok=True, time=self._elapsed_time(run_start))
         except RPCException as ex:
             message = dict(ex.args[0])["message"]
             logger.error(f"failed to transfer token. RPC error: {message}")
+            if BLOCKHASH_NOT_FOUND.search(f"{ex}"):
+                self._invalidate_recent_blockhash(transaction.recent_blockhash)
             return response.update(err=f"{ex}", ok=False, time=self._elapsed_time(run_start))
         except Exception as ex:
             logger.error(f"failed to transfer token. error: {ex}")
             return response.update(err=f"{ex}", ok=False, time=self._elapsed_time(run_start))
 
+    def _get_transfer_instruction(self, dest: PublicKey, amount_lamport: int) -> TransactionInstruction:
+        """Build a transfer_checked instruction from the pre-built template, only the dest and amount are set.
+
+        :param dest: The recipient token account.
+        :param amount_lamport: The amount to transfer, in lamports.
+        """
+        source, mint, _, owner = self.transfer_instruction_template.keys
+        return TransactionInstruction(
+            keys=[source, mint, AccountMeta(pubkey=dest, is_signer=False, is_writable=True), owner],
+            program_id=TOKEN_PROGRAM_ID,
+            data=struct.pack("<BQB", TRANSFER_CHECKED_INSTRUCTION, amount_lamport, self.token_decimals),
+        )
+
+    @staticmethod
+    def _get_compute_budget_instructions(compute_units: int, priority_fee: int) -> List[TransactionInstruction]:
+        """Build the compute budget instructions that set the transaction compute units limit and price.
+
+        :param compute_units: Max compute units the transaction may consume.
+        :param priority_fee: Compute unit price in micro lamports.
+        """
+        return [
+            TransactionInstruction(
+                keys=[],
+                program_id=COMPUTE_BUDGET_PROGRAM_ID,
+                data=struct.pack("<BI", SET_COMPUTE_UNIT_LIMIT_INSTRUCTION, compute_units),
+            ),
+            TransactionInstruction(
+                keys=[],
+                program_id=COMPUTE_BUDGET_PROGRAM_ID,
+                data=struct.pack("<BQ", SET_COMPUTE_UNIT_PRICE_INSTRUCTION, priority_fee),
+            ),
+        ]
+
+    def _get_create_associated_account_instruction(self, owner: PublicKey) -> TransactionInstruction:
+        """Build an idempotent create associated token account instruction, paid by the configured keypair.
+        Unlike the plain create instruction, it doesn't fail when the account already exists (e.g. on a re-send).
+
+        :param owner: The address that need to create a token associated address for.
+        """
+        instruction = spl_token.create_associated_token_account(
+            payer=self.keypair.public_key, owner=owner, mint=self.token_mint_public_key
+        )
+        return instruction._replace(data=bytes([CREATE_IDEMPOTENT_INSTRUCTION]))
+
+    def sign_transaction(self, transaction: Transaction) -> str:
+        """Set a recent blockhash to the transaction and sign it, returns the transaction signature.
+        The last blockhash is re-used for up to BLOCKHASH_MAX_USES transactions or BLOCKHASH_TTL_SEC seconds,
+        to save a getRecentBlockhash call per transfer.
+        Identical transactions (same dest and amount) signed with the same blockhash get the same signature,
+        and only one of them is processed. So a transaction already signed with the blockhash gets a newer one.
+
+        :param transaction: The transaction to sign, with all its instructions.
+        """
+        stale_blockhash = None
+        for _ in range(BLOCKHASH_REFRESH_ATTEMPTS):
+            # bulk transfers call it from multiple threads, the lock is held only to sign with the cached blockhash
+            with self.recent_blockhash_lock:
+                blockhash = self.recent_blockhash
+                expired = self.clock_time() - self.recent_blockhash_time > BLOCKHASH_TTL_SEC
+                usable = not expired and self.recent_blockhash_uses < BLOCKHASH_MAX_USES
+                if blockhash and blockhash != stale_blockhash and usable:
+                    transaction.recent_blockhash = blockhash
+                    transaction.sign(self.keypair)
+                    signature = base58.b58encode(transaction.signature()).decode()
+                    signatures = self.recent_blockhash_signatures[blockhash]
+                    if signature not in signatures:
+                        signatures.add(signature)
+                        self.recent_blockhash_uses += 1
+                        return signature
+                    logger.info(f"transaction {signature} already signed with blockhash {blockhash}")
+                    stale_blockhash = blockhash
+            response = self.client.get_recent_blockhash(Finalized)
+            blockhash = response["result"]["value"]["blockhash"]
+            if blockhash == stale_blockhash:
+                time.sleep(BLOCKHASH_REFRESH_SLEEP_SEC)
+                continue
+            self._set_recent_blockhash(blockhash)
+        raise RPCException({"message": f"failed to get a blockhash newer than {stale_blockhash}"})
+
+    def _set_recent_blockhash(self, blockhash: str):
+        """Set the blockhash to sign the next transactions with.
+
+        :param blockhash: A recent blockhash.
+        """
+        with self.recent_blockhash_lock:
+            self.recent_blockhash = blockhash
+            self.recent_blockhash_time = self.clock_time()
+            self.recent_blockhash_uses = 0
+            self.recent_blockhash_signatures.setdefault(blockhash, set())
+            while len(self.recent_blockhash_signatures) > BLOCKHASH_SIGNATURES_KEPT:
+                del self.recent_blockhash_signatures[next(iter(self.recent_blockhash_signatures))]
+
+    def _invalidate_recent_blockhash(self, blockhash: str):
+        """Stop signing with the given blockhash, in case the cluster rejected it.
+
+        :param blockhash: The blockhash of the rejected transaction.
+        """
+        with self.recent_blockhash_lock:
+            if self.recent_blockhash == blockhash:
+                self.recent_blockhash = None
+
     def create_associated_token_account(self, owner: str) -> Response:
         """Create an associated token account
 
@@ -289,15 +629,22 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         in_process = in_process or self.bulk_transfer_token_handler.in_process
 
         total_items = len(in_process)
-        total_amount_transferred = sum(float(i["amount"]) for i in in_process.values() if i["signature"])
+        total_items_with_no_signature = items_with_signature_but_not_finalized = 0
+        total_to_transfer = total_amount_transferred = total_not_confirmed_to_transfer = Decimal(0)
+        for item in in_process.values():
+            amount = Decimal(str(item["amount"]))
+            total_to_transfer += amount
+            if item["signature"]:
+                total_amount_transferred += amount
+                items_with_signature_but_not_finalized += not item["finalized"]
+            else:
+                total_items_with_no_signature += 1
+            if not item["finalized"]:
+                total_not_confirmed_to_transfer += amount
+        total_amount_not_transferred = total_to_transfer - total_amount_transferred
         total_amount_transferred_str = f"{total_amount_transferred:,.4f}"
-        total_items_with_no_signature = sum(not i["signature"] for i in in_process.values())
-        items_with_signature_but_not_finalized = sum(not i["finalized"] for i in in_process.values() if i["signature"])
-        total_not_confirmed_to_transfer = sum(float(i["amount"]) for i in in_process.values() if not i["finalized"])
         total_not_confirmed_to_transfer_str = f"{total_not_confirmed_to_transfer:,.4f}"
-        total_to_transfer = sum(float(i["amount"]) for i in in_process.values())
         total_to_transfer_str = f"{total_to_transfer:,.4f}"
-        total_amount_not_transferred = sum(float(i["amount"]) for i in in_process.values() if not i["signature"])
         total_amount_not_transferred_str = f"{total_amount_not_transferred:,.4f}"
 
         if log_sum:
@@ -322,6 +669,9 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         dry_run: bool = False,
         skip_confirm: bool = False,
         ignore_unfinalized_signature: bool = False,
+        pool_size: int = 32,
+        priority_fee: Optional[int] = None,
+        skip_preflight: bool = False,
     ):
         """Transfer token to multiple addresses, based on the content of transfer_csv_path.
 
@@ -329,6 +679,12 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         :param dry_run: When true the transactions will be skipped.
         :param skip_confirm: When true transaction confirmation will be skipped. Run will be faster but less reliable.
         :param ignore_unfinalized_signature: When true actions with un-finalized transaction will retry processing.
+        :param pool_size: Max number of actions to run concurrently.
+        :param priority_fee: Compute unit price in micro lamports for the transfers.
+            (default taken from the `{env}_priority_fee` config, no priority fee when 0)
+        :param skip_preflight: If true the transfers are sent without the rpc node simulating them first.
+            Faster, a transfer that fails on chain is found by the confirmation step, which stores its error
+            and clears its signature, so the next run retries it.
 
         >>> from solen import TokenClient
         >>> token_client = TokenClient("main")
@@ -338,8 +694,9 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         Cy4y1XGR9pj7vFikWVGrdQAPWCChqV9gQHCLht6eXBLW,0.001
         Cy4y1XGR9pj7vFikWVGrdQAPWCChqV9gQHCLht6eXBLW,0.001
         """
+        action_kwargs = {"priority_fee": priority_fee, "skip_preflight": skip_preflight}
         transfer_response = self.bulk_transfer_token_handler.bulk_run(
-            csv_path, dry_run, skip_confirm, ignore_unfinalized_signature
+            csv_path, dry_run, skip_confirm, ignore_unfinalized_signature, pool_size, action_kwargs
         )
         if not transfer_response.ok:
             logger.error(f"failed to transfer, err: {transfer_response.err}")
@@ -367,22 +724,25 @@ class TokenClient:  # pylint: disable=too-many-instance-attributes
         """
         token_mint = token_mint or self.token_mint
         memcmp_opts = [MemcmpOpt(offset=0, bytes=token_mint)]
+        # only the owner and amount of the token account layout are fetched (mint, owner, amount, ...)
+        data_slice = DataSliceOpts(offset=TOKEN_ACCOUNT_OWNER_OFFSET, length=40)
         result = self.client.get_program_accounts(
-            pubkey=TOKEN_PROGRAM_ID, encoding="jsonParsed", data_size=165, memcmp_opts=memcmp_opts
+            pubkey=TOKEN_PROGRAM_ID,
+            encoding="base64",
+            data_slice=data_slice,
+            data_size=165,
+            memcmp_opts=memcmp_opts,
         )
 
         # extract owner to quantity dict
         holders = Counter()
         for data in result["result"]:
-            owner = data["account"]["data"]["parsed"]["info"]["owner"]
-            amount = data["account"]["data"]["parsed"]["info"]["tokenAmount"]["uiAmount"]
-            holders[owner] += amount
-
-        # sort
-        items = list(holders.items())
-        items.sort(key=lambda x: x[1], reverse=True)
+            raw = base64.b64decode(data["account"]["data"][0])
+            holders[base58.b58encode(raw[:32]).decode()] += struct.unpack_from("<Q", raw, 32)[0]
 
-        return items
+        # sorted by amount, descending
+        multiplier = 10 ** self.get_token_decimals(token_mint)
+        return [(owner, amount / multiplier) for owner, amount in holders.most_common()]
 
     def get_transactions_for_address(self, address: str, limit: int = 100) -> List[DotDict]:
         """Get transactions data for a given address.
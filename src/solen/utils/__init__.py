@@ -1,3 +1,4 @@
 from .arweave import Arweave
+from .session import get_session, create_client
 from .bulk_handler import BulkHandler
 from .config_parser import ConfigParser
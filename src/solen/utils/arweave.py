@@ -2,13 +2,21 @@ import os
 import glob
 import json
 import time
+import random
 import logging
+import threading
 from typing import Union
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from asyncit import Asyncit
 from asyncit.dicts import DotDict
 
+from .jsonio import dump_json, json_dumps
+from .session import get_session
+from .bulk_handler import open_journal, load_in_process_file, save_in_process_file
+
 try:
     from arweave.arweave_lib import Wallet, Transaction
     from arweave.transaction_uploader import get_uploader
@@ -59,11 +67,12 @@ class Arweave:
         logger.info("dome uploading, going to validate url")
         return url if self.validate_upload(url) else False
 
-    def upload_file(self, file_path: str, content_type=None) -> Union[str, None]:
+    def upload_file(self, file_path: str, content_type=None, validate: bool = True) -> Union[str, None]:
         """Get path of the file to upload and return the url of the file's data in arweave.
 
         :param file_path: Path to the file to upload.
         :param content_type: The type of the file.
+        :param validate: If false the url is returned without waiting for the data to be available (validate_upload).
         """
         if not os.path.isfile(f"{file_path}"):
             raise FileNotFoundError
@@ -80,7 +89,7 @@ class Arweave:
 
         logger.info(f"going to upload: {file_path}")
         try:
-            with open(file_path, "rb", buffering=0) as file_handler:
+            with open(file_path, "rb") as file_handler:
                 tx = Transaction(self.wallet, file_handler=file_handler, file_path=file_path)
                 tx.add_tag("Content-Type", content_type)
                 tx.sign()
@@ -93,6 +102,8 @@ class Arweave:
             logger.error(f"failed to upload file: {file_path}, ex: {ex}")
             return None
 
+        if not validate:
+            return url
         return url if self.validate_upload(url) else False
 
     def upload_pair(self, json_file_path: str, png_file_path: str) -> Union[str, None]:
@@ -121,13 +132,14 @@ class Arweave:
         logger.error("failed to upload the json file")
         return None
 
-    def upload_from_folder(self, folder_file_path: str):
+    def upload_from_folder(self, folder_file_path: str, pool_size: int = 8):
         """Handle upload pairs of (json, png) from folder.
 
         The folder expects to contain json and png files with the same name.
         Names should be numbers from 0 and up, for example: 0.json, 0.png, 2.json, 1.png.
 
         :param folder_file_path: Path to a folder that should contain jsons and pngs.
+        :param pool_size: Max number of pairs to upload concurrently.
 
         >>> ar = Arweave("path to your wallet key pair file")
         >>> ar.upload_from_folder("/some/folder/on/your/system")
@@ -145,36 +157,47 @@ class Arweave:
         folder_name = Path(folder_file_path).stem
         in_process_file = self.config_folder.joinpath(f"{folder_name}.json")
         if in_process_file.exists():
-            uploads_data = json.loads(in_process_file.read_text(encoding="utf-8"))
+            uploads_data = load_in_process_file(in_process_file)
         else:
-            json_files = glob.glob(f"{folder_file_path}/*.json")
-            png_files = glob.glob(f"{folder_file_path}/*.png")
-            json_names = {i.split(".")[0] for i in json_files}
-            png_names = {i.split(".")[0] for i in png_files}
-            if len(json_names - png_names) > 0 or len(png_names - json_names) > 0:
+            files_by_name = {}
+            with os.scandir(folder_file_path) as entries:
+                for entry in entries:
+                    name, _, extension = entry.name.rpartition(".")
+                    if extension in ("json", "png"):
+                        files_by_name.setdefault(name, {})[extension] = entry.path
+            if any(len(files) != 2 for files in files_by_name.values()):
                 logger.error(f"folder {folder_file_path} contain invalid couples of json and png files")
                 return
 
-            pairs = []
-            for json_file in json_files:
-                if json_file.split(".")[0] + ".png" in png_files:
-                    png_file = json_file.split(".")[0] + ".png"
-                    pairs.append(tuple((json_file, png_file)))
+            pairs = [(files["json"], files["png"]) for files in files_by_name.values()]
             uploads_data = {}
             for index, pair in enumerate(pairs):
                 pair_data = {"json_file": pair[0], "png_file": pair[1], "json_url": "", "success": False}
-                uploads_data[index] = pair_data
+                uploads_data[str(index)] = pair_data
+            dump_json(in_process_file, uploads_data)
+
+        lock = threading.Lock()
+        # each succeeded upload is appended to a journal, which is compacted into the in-process file at the end
+        save_in_process_file(in_process_file, uploads_data, changed=False)
+        journal = open_journal(in_process_file)
 
+        def upload(index, pair_data):
+            json_url = self.upload_pair(pair_data.json_file, pair_data.png_file)
+            if json_url:
+                update = {"json_url": json_url, "success": True}
+                with lock:
+                    uploads_data[index].update(update)
+                    os.write(journal, json_dumps({"index": index, **update}) + b"\n")
+
+        asyncit = Asyncit(pool_size=pool_size)
         for index, pair_data in uploads_data.items():
             pair_data = DotDict(pair_data)
             if pair_data.success:
                 continue
-
-            json_url = self.upload_pair(pair_data.json_file, pair_data.png_file)
-            if json_url:
-                uploads_data[index]["json_url"] = json_url
-                uploads_data[index]["success"] = True
-                in_process_file.write_text(json.dumps(uploads_data), encoding="utf-8")
+            asyncit.run(upload, index, pair_data)
+        asyncit.wait()
+        os.close(journal)
+        save_in_process_file(in_process_file, uploads_data, changed=False)
 
     def validate_upload(self, url: str) -> bool:
         """Check if upload succeeded.
@@ -182,14 +205,19 @@ class Arweave:
         :param url: The url of the data in arweave.
         """
         timeout = 60
+        sleep_time = 0.1
         response = None
-        for i in range(timeout):
-            response = requests.get(url)
-            if response.status_code == 200:
-                logger.info(f"upload succeeded: {url}")
-                return True
-
-            time.sleep(1)
+        run_start = time.perf_counter()
+        while time.perf_counter() - run_start < timeout:
+            try:
+                response = get_session().get(url, timeout=10)
+                if response.status_code == 200:
+                    logger.info(f"upload succeeded: {url}")
+                    return True
+            except requests.RequestException as ex:
+                response = ex
+            time.sleep(sleep_time * random.uniform(1, 1.3))
+            sleep_time = min(5.0, sleep_time * 1.7)
 
         logger.error(f"couldn't find link with the data, response: {response}")
         return False
@@ -213,10 +241,14 @@ class Arweave:
             json.dump(data, f)
             f.truncate()
 
-    def bulk_upload_json_files(self, folder_file_path: str):
+    def bulk_upload_json_files(self, folder_file_path: str, pool_size: int = 8):
         """Upload all json files in folder.
 
         :param folder_file_path: Path to folder (should contain json files).
+        :param pool_size: Max number of files to upload concurrently.
+
+        The urls of the uploaded files are kept in [self.config_folder]/[folder_name].json, by the file name.
+        In case of upload failures you can run the function again - it'll upload only the files not in it.
         """
         if not os.path.isdir(folder_file_path):
             raise NotADirectoryError
@@ -224,13 +256,37 @@ class Arweave:
         if not self.config_folder:
             raise ValueError("Missing config folder")
 
-        uploads_data = {}
         folder_name = Path(folder_file_path).stem
         in_process_file = self.config_folder.joinpath(f"{folder_name}.json")
-        json_files = glob.glob(f"{folder_file_path}/*.json")
-        for json_file in json_files:
-            url = self.upload_file(json_file)
+        uploads_data = load_in_process_file(in_process_file) if in_process_file.exists() else {}
+        json_files = [path for path in glob.glob(f"{folder_file_path}/*.json") if Path(path).stem not in uploads_data]
+        lock = threading.Lock()
+        # each validated upload is appended to a journal, which is compacted into the in-process file at the end
+        save_in_process_file(in_process_file, uploads_data, changed=False)
+        journal = open_journal(in_process_file)
+        # the uploads are validated on a separate pool, so the next uploads don't wait for the validation polls
+        validate_executor = ThreadPoolExecutor(max_workers=4 * pool_size)
+        validate_futures = []
+
+        def validate(json_file, url):
+            if self.validate_upload(url):
+                key = Path(json_file).stem
+                with lock:
+                    uploads_data[key] = url
+                    os.write(journal, json_dumps({"key": key, "value": url}) + b"\n")
+
+        def upload(json_file):
+            url = self.upload_file(json_file, validate=False)
             if url:
-                file_name = Path(json_file).stem
-                uploads_data[file_name] = url
-                in_process_file.write_text(json.dumps(uploads_data), encoding="utf-8")
+                validate_futures.append(validate_executor.submit(validate, json_file, url))
+
+        asyncit = Asyncit(pool_size=pool_size)
+        for json_file in json_files:
+            asyncit.run(upload, json_file)
+        asyncit.wait()
+        validate_executor.shutdown(wait=True)
+        for future in validate_futures:
+            if future.exception():
+                logger.error(f"failed to validate upload, ex: {future.exception()}")
+        os.close(journal)
+        save_in_process_file(in_process_file, uploads_data)
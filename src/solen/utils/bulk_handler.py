@@ -1,25 +1,117 @@
 import os
+import re
 import csv
-import json
 import time
+import random
+import asyncio
 import logging
-from typing import Dict, List, Union, Optional
+import threading
+from typing import Dict, List, Optional
 from pathlib import Path
 from datetime import timedelta
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
-from asyncit import Asyncit
 from asyncit.dicts import DotDict
 from solana.rpc.commitment import COMMITMENT_RANKS, Confirmed, Finalized, Processed, Commitment
 
+from .jsonio import msgpack, dump_json, load_json, json_dumps, json_loads
+from ..core.constants import MAX_SIGNATURE_STATUSES
+
 logger = logging.getLogger(__name__)
-open_utf8 = partial(open, encoding="UTF-8")
+
+REMOVE_COMMAS = str.maketrans("", "", ",")
+
+# during a bulk run each handled item is appended to a journal file next to the in-process file,
+# which is compacted into the in-process file every this number of handled items (and at the end)
+COMPACT_EVERY_ITEMS = 1000
+
+# bulk files with more items than this are kept in msgpack format (when msgpack is installed)
+MSGPACK_MIN_ITEMS = 50_000
+
+# matches both the rpc message ("Blockhash not found") and the transaction error name ("BlockhashNotFound")
+BLOCKHASH_NOT_FOUND = re.compile(r"Blockhash ?not ?found", re.IGNORECASE)
+
+# action errors that are rejected before the transaction is processed, so the action can safely be retried.
+# for example: "RPC error: Node is behind by 169 slots" - it takes at least a sec to start working again.
+# the 429 status is matched only as an http error or an rpc error code, not as any number in the message.
+TRANSIENT_ERRORS = re.compile(
+    rf"Node is behind by|{BLOCKHASH_NOT_FOUND.pattern}|Too Many Requests|\b429 Client Error\b|['\"]code['\"]: ?429\b",
+    re.IGNORECASE,
+)
+MAX_ACTION_ATTEMPTS = 5
+
+# bulk run actions are started at most this number per second, to keep under the rpc node rate limits
+MAX_ACTIONS_PER_SEC = 50
+
+
+def get_journal_path(in_process_file: Path) -> Path:
+    """Get the path of the journal file, holding the updates not yet compacted into the in-process file."""
+    return in_process_file.with_suffix(in_process_file.suffix + ".journal")
+
+
+def open_journal(in_process_file: Path) -> int:
+    """Open the journal file of the in-process file for appending, and return its file descriptor.
+    Each os.write to it is durable once it returns (O_DSYNC), without flushing the file metadata.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_DSYNC", 0)
+    return os.open(get_journal_path(in_process_file), flags, 0o644)
+
+
+def load_in_process_file(in_process_file: Path) -> Dict:
+    """Load the in-process file, and apply the updates of its journal (if exists).
+    Each journal line is a json object with the "index" of the item to update, and the updated fields.
+    Or, for in-process data of plain values, with the "key" of the item to set and its "value".
+
+    :param in_process_file: Path to the in-process file.
+    """
+    in_process = load_json(in_process_file)
+    journal_file = get_journal_path(in_process_file)
+    if journal_file.exists():
+        with open(journal_file, "rb") as f:
+            for line in f:
+                try:
+                    update = json_loads(line)
+                except ValueError:
+                    # the last line might be partial, in case the run was killed while writing it
+                    logger.warning(f"skipping invalid journal line: {line}")
+                    continue
+                if "index" in update:
+                    in_process[update.pop("index")].update(update)
+                else:
+                    in_process[update["key"]] = update["value"]
+    return in_process
+
+
+def save_in_process_file(in_process_file: Path, in_process: Dict, changed: bool = True):
+    """Write the in-process data to its file, and remove the journal (its updates are part of the data).
+
+    :param in_process_file: Path to the in-process file.
+    :param in_process: The in-process data.
+    :param changed: If false, the data is written only in case there is a journal to compact.
+    """
+    journal_file = get_journal_path(in_process_file)
+    if changed or journal_file.exists():
+        dump_json(in_process_file, in_process)
+    if journal_file.exists():
+        journal_file.unlink()
 
 
 class BulkHandler:  # pylint: disable=too-many-instance-attributes
     """Handle class for bulk Solana actions."""
 
-    def __init__(self, client, env, data_folder, action_callback, sum_info_callback, action_name, columns):
+    def __init__(
+        self,
+        client,
+        env,
+        data_folder,
+        action_callback,
+        sum_info_callback,
+        action_name,
+        columns,
+        prepare_callback=None,
+        ws_endpoint=None,
+        read_callback=None,
+    ):
         self.client = client
         self.env = env
         self.clock_time = time.perf_counter
@@ -27,6 +119,9 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
         self.action = action_callback
         self.action_name = action_name
         self.sum_info = sum_info_callback
+        self.prepare = prepare_callback
+        self.ws_endpoint = ws_endpoint
+        self.read = read_callback or (lambda method, *args, **kwargs: getattr(self.client, method)(*args, **kwargs))
         self.run_start = self.clock_time()
         self.columns = columns
         self.in_process = {}
@@ -42,30 +137,52 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
         return str(timedelta(seconds=elapsed_time)).split(".", maxsplit=1)[0]
 
     def process_transfer_csv(self, csv_path: str) -> Dict:
-        """Read the csv file and return dict of all the lines. The line index is the key.
+        """Read the csv file and return dict of all the lines. The line index (str, as in the json file) is the key.
 
         :param csv_path: Path to a csv file with the actions to perform.
         """
         in_process_init = {}
-        with open_utf8(csv_path) as f:
-            reader = csv.DictReader(f)
-            for i, row in enumerate(reader):
-                row_data = {}
-                for column in self.columns:
-                    row_data[column] = row[column].replace(",", "")
+        columns = self.columns
+        # utf-8-sig drops the BOM that excel adds to the file start, which would be part of the first column name
+        with open(csv_path, encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            indices = [header.index(column) for column in columns]
+            for row in reader:
+                if not any(row):
+                    continue
+                row_data = {column: row[index].translate(REMOVE_COMMAS) for column, index in zip(columns, indices)}
                 row_data.update(finalized=False, signature="", error="")
-                in_process_init[i] = row_data
+                in_process_init[str(len(in_process_init))] = row_data
         return in_process_init
 
     def _get_in_process_json_path(self, csv_path: str) -> Path:
         """Convert csv the path to the json config file path, in the solen config folder.
+        In case a msgpack config file was created for the csv (large bulks), its path is returned.
 
         :param csv_path: Path to a csv file with the actions to perform.
         """
         csv_name = os.path.basename(csv_path)
         csv_new_suffix = csv_name.replace(".csv", ".json")
         csv_with_prefix = f"{self.env}_{csv_new_suffix}"
-        return self.data_folder.joinpath(csv_with_prefix)
+        in_process_file = self.data_folder.joinpath(csv_with_prefix)
+        msgpack_file = in_process_file.with_suffix(".msgpack")
+        return msgpack_file if msgpack_file.exists() else in_process_file
+
+    def load_in_process(self, in_process_file: Path) -> Dict:
+        """Load the in-process file, and apply the updates of its journal (if exists).
+
+        :param in_process_file: Path to the in-process file.
+        """
+        return load_in_process_file(in_process_file)
+
+    def save_in_process(self, in_process_file: Path, changed: bool = True):
+        """Write the in-process data to its file, and remove the journal (its updates are part of the data).
+
+        :param in_process_file: Path to the in-process file.
+        :param changed: If false, the data is written only in case there is a journal to compact.
+        """
+        save_in_process_file(in_process_file, self.in_process, changed)
 
     def bulk_init(self, csv_path: str) -> Dict:
         """Create the bulk process file based on given CSV file.
@@ -83,14 +200,16 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
         in_process_file = self._get_in_process_json_path(csv_path)
         if in_process_file.exists():
             logger.info(f"process config file: {in_process_file}")
-            self.in_process = json.loads(in_process_file.read_text(encoding="utf-8"))
+            self.in_process = self.load_in_process(in_process_file)
             self.sum_info(self.in_process, log_sum=True)
             return self.in_process
         logger.info(f"going to create bulk process file based on file: {csv_path}")
         in_process_init = self.process_transfer_csv(csv_path)
-        in_process_file.write_text(json.dumps(in_process_init), encoding="utf-8")
+        if msgpack and len(in_process_init) > MSGPACK_MIN_ITEMS:
+            in_process_file = in_process_file.with_suffix(".msgpack")
+        dump_json(in_process_file, in_process_init)
         logger.info(f"process config file been created: {in_process_file}")
-        self.in_process = json.loads(in_process_file.read_text(encoding="utf-8"))
+        self.in_process = in_process_init
         self.sum_info(self.in_process, log_sum=True)
         return self.in_process
 
@@ -100,6 +219,8 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
         dry_run: bool = False,
         skip_confirm: bool = False,
         ignore_unfinalized_signature: bool = False,
+        pool_size: int = 32,
+        action_kwargs: Optional[Dict] = None,
     ):
         """Transfer token to multiple addresses, based on the content of transfer_csv_path.
 
@@ -107,6 +228,8 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
         :param dry_run: When true the transactions will be skipped.
         :param skip_confirm: When true transaction confirmation will be skipped. Run will be faster but less reliable.
         :param ignore_unfinalized_signature: When true actions with un-finalized transaction will retry processing.
+        :param pool_size: Max number of actions to run concurrently.
+        :param action_kwargs: Extra keyword arguments passed to every action call of this run.
 
         when csv should contain action data, that can be parsed by the actions function.
         """
@@ -125,44 +248,81 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
         if not in_process_file.exists():
             logger.error(f"missing json config file: ({in_process_file}). run bulk-transfer init command to create it")
             return response.update(ok=False, err=f"missing json config file: ({in_process_file}).")
-        self.in_process = json.loads(in_process_file.read_text(encoding="utf-8"))
+        self.in_process = self.load_in_process(in_process_file)
         total_items = len(self.in_process)
-        left_items = sum(not i["signature"] for i in self.in_process.values())
-        logger.info(f"going to handle {left_items} out of {total_items} actions")
-        counter = 0
+        left_items = 0
+        pending_items = []
         for i, item in self.in_process.items():
-            if not ignore_unfinalized_signature and item.get("signature"):
-                continue
-            if item.get("finalized"):
-                continue
-            counter += 1
+            left_items += not item["signature"]
+            if not item.get("finalized") and (ignore_unfinalized_signature or not item.get("signature")):
+                pending_items.append((i, item))
+        logger.info(f"going to handle {left_items} out of {total_items} actions")
+        if self.prepare and not dry_run:
+            self.prepare([item for _, item in pending_items])
+        lock = threading.Lock()
+        handled = []
+        # a journal left by a killed run is compacted first, its last line might be partial
+        self.save_in_process(in_process_file, changed=False)
+        journal = open_journal(in_process_file)
+
+        def handle_item(i, item, counter):
             logger.info(f"[{i}] [{self._elapsed_time()}] handle {self.action_name} {counter}/{left_items}")
-            transfer_args = DotDict(dry_run=dry_run)
+            transfer_args = DotDict(action_kwargs or {}, dry_run=dry_run)
             for column in self.columns:
                 transfer_args[column] = item[column]
             if skip_confirm:
                 transfer_args.skip_confirmation = True
                 transfer_args.commitment = Processed
-            response = self.action(**transfer_args)
+            action_response = self.action(**transfer_args)
+            for attempt in range(1, MAX_ACTION_ATTEMPTS):
+                if action_response.ok or not TRANSIENT_ERRORS.search(action_response.err or ""):
+                    break
+                backoff = min(8.0, 0.5 * 2**attempt) + random.uniform(0, 0.1)
+                logger.warning(f"[{i}] retry {attempt} in {backoff:.1f}s, error: {action_response.err}")
+                time.sleep(backoff)
+                action_response = self.action(**transfer_args)
             if dry_run:
-                continue
-            if not response.ok:
-                self.in_process[i].update({"error": response.err, "time": response.time})
-                if "Node is behind by" in response.err:
-                    # When this error occurs (like "RPC error: Node is behind by 169 slots")
-                    # it'll take at least a sec to start working again. keep trying will keep failing
-                    time.sleep(1)
+                return
+            if not action_response.ok:
+                update = {"error": action_response.err, "time": action_response.time}
             else:
-                self.in_process[i].update({"signature": response.signature, "error": "", "time": response.time})
-            in_process_file.write_text(json.dumps(self.in_process), encoding="utf-8")
+                update = {"signature": action_response.signature, "error": "", "time": action_response.time}
+            with lock:
+                self.in_process[i].update(update)
+                os.write(journal, json_dumps({"index": i, **update}) + b"\n")
+                handled.append(i)
+                if len(handled) % COMPACT_EVERY_ITEMS == 0:
+                    dump_json(in_process_file, self.in_process)
+                    os.ftruncate(journal, 0)
+
+        # each action waits for its own start time slot, so the actions are spread over time
+        next_start = [time.monotonic()]
+
+        def handle_item_rate_limited(i, item, counter):
+            with lock:
+                start = max(next_start[0], time.monotonic())
+                next_start[0] = start + 1 / MAX_ACTIONS_PER_SEC
+            time.sleep(max(0.0, start - time.monotonic()))
+            handle_item(i, item, counter)
+
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            futures = {
+                executor.submit(handle_item_rate_limited, i, item, counter): i
+                for counter, (i, item) in enumerate(pending_items, start=1)
+            }
+            for future, i in futures.items():
+                if future.exception():
+                    logger.error(f"[{i}] failed to handle {self.action_name}: {future.exception()}")
+        os.close(journal)
+        self.save_in_process(in_process_file, changed=bool(handled))
         logger.info(f"Bulk run completed after {self._elapsed_time(run_start)}.")
-        self.in_process = json.loads(in_process_file.read_text(encoding="utf-8"))
         return response.update(ok=True)
 
-    def bulk_confirm(self, csv_path: str):
+    def bulk_confirm(self, csv_path: str, timeout: int = 60):
         """Verify that transfer amount transaction signatures are finalized.
 
         :param csv_path: Path to a csv file in the format of: wallet,amount.
+        :param timeout: Timeout in seconds to wait for the websocket confirmations.
         """
         csv_path = os.path.expanduser(csv_path)
         run_start = self.clock_time()
@@ -170,67 +330,143 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
         if not in_process_file.exists():
             logger.error(f"missing in-process file: ({in_process_file})")
             return
-        self.in_process = json.loads(in_process_file.read_text(encoding="utf-8"))
+        self.in_process = self.load_in_process(in_process_file)
         total_items = len(self.in_process)
-        left_items = sum(not i["finalized"] for i in self.in_process.values())
-        logger.info(f"going to confirm {left_items} left not verified, out of {total_items} records")
-
-        asyncit = Asyncit(
-            save_output=True, save_as_json=True, pool_size=200, rate_limit=[{"period_sec": 5, "max_calls": 100}]
-        )
+        total_finalized = 0
+        # item index: signature. items with the same signature are the same transaction, only one of them is done
+        pending = {}
+        signature_items = {}
+        duplicates = []
         for i, item in self.in_process.items():
-            if not item.get("signature"):
-                continue
             if item.get("finalized"):
-                continue
-            asyncit.run(self.confirm_transaction, item["signature"], response_extra={"index": str(i)})
-        asyncit.wait()
-        confirm_result = asyncit.get_output()
-        if not confirm_result:
+                total_finalized += 1
+                signature_items.setdefault(item["signature"], i)
+            elif item.get("signature"):
+                pending[i] = item["signature"]
+        for i, signature in pending.items():
+            if signature_items.setdefault(signature, i) != i:
+                duplicates.append(i)
+        for i in duplicates:
+            signature = pending.pop(i)
+            logger.warning(f"[{i}] transaction {signature} is of item {signature_items[signature]}, going to retry it")
+            self.in_process[i].update(error=f"duplicate signature {signature}", signature="")
+        left_items = total_items - total_finalized
+        logger.info(f"going to confirm {left_items} left not verified, out of {total_items} records")
+
+        confirm_result = []
+        if pending and self.ws_endpoint:
+            try:
+                landed = asyncio.run(self._await_confirmations_ws(list(pending.values()), timeout=timeout))
+                for i, signature in list(pending.items()):
+                    if signature in landed:
+                        err = landed[signature]
+                        confirm_result.append({"index": i, "confirmed": not err, "err": err})
+                        del pending[i]
+            except Exception as ex:
+                logger.warning(f"failed to confirm transactions using websocket, going to poll. ex: {ex}")
+
+        if pending:
+            statuses = self.confirm_transactions_bulk(list(pending.values()))
+            for i, signature in pending.items():
+                confirm_result.append({"index": i, **statuses[signature]})
+        if not confirm_result and not duplicates:
             logger.info("nothing to update in process file")
             return
+        total_failed = 0
         for result in confirm_result:
-            self.in_process[result["index"]]["finalized"] = result["confirmed"]
-        in_process_file.write_text(json.dumps(self.in_process), encoding="utf-8")
-        total_finalized = sum(i["finalized"] for i in self.in_process.values())
+            item = self.in_process[result["index"]]
+            item["finalized"] = result["confirmed"]
+            total_finalized += bool(result["confirmed"])
+            if result["err"]:
+                # the transaction landed but failed, the signature is cleared so the next run will retry the item
+                item.update(error=f"transaction {item['signature']} failed: {result['err']}", signature="")
+                total_failed += 1
+        self.save_in_process(in_process_file)
         logger.info(
             f"Done after {self._elapsed_time(run_start)}. total finalized: {total_finalized} / {len(self.in_process)}"
+            f" (failed: {total_failed})"
         )
 
+    async def _await_confirmations_ws(
+        self, signatures: List[str], commitment: Commitment = Finalized, timeout: int = 60
+    ) -> Dict[str, Optional[Dict]]:
+        """Wait for transactions confirmation using a single websocket connection.
+        Returns dict of signature: error, for the transactions that landed (the error is None when succeeded).
+
+        :param signatures: The transaction signatures to confirm.
+        :param commitment: Bank state to wait for. It can be either "finalized", "confirmed" or "processed".
+        :param timeout: Timeout in seconds to wait for all the confirmations.
+        """
+        from solana.rpc.responses import SignatureNotification  # pylint: disable=import-outside-toplevel
+        from solana.rpc.websocket_api import connect  # pylint: disable=import-outside-toplevel
+
+        landed = {}
+        pending = set(signatures)
+
+        async def receive_notifications(websocket):
+            while pending:
+                messages = await websocket.recv()
+                for message in messages if isinstance(messages, list) else [messages]:
+                    if not isinstance(message, SignatureNotification):
+                        continue
+                    signature = websocket.subscriptions[message.subscription]["params"][0]
+                    err = message.result.value.err
+                    if err:
+                        logger.warning(f"transaction {signature} failed: {err}")
+                    else:
+                        logger.debug(f"transaction {signature} confirmed ({commitment})")
+                    pending.discard(signature)
+                    landed[signature] = err
+
+        async with connect(self.ws_endpoint) as websocket:
+            for signature in signatures:
+                await websocket.signature_subscribe(signature, commitment=commitment)
+            try:
+                await asyncio.wait_for(receive_notifications(websocket), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"timeout occurred on waiting for {len(pending)} websocket confirmations")
+        return landed
+
     def confirm_transaction(
         self,
         tx_sig: str,
         commitment: Commitment = Finalized,
-        sleep_seconds: float = 1.0,
+        sleep_seconds: float = 0.2,
         response_extra: Optional[Dict] = None,
         timeout: Optional[int] = 30,
+        max_sleep_seconds: float = 2.0,
     ) -> Dict:
         """Confirm the transaction identified by the specified signature.
 
         :param tx_sig: The transaction signature to confirm.
         :param commitment: Bank state to query. It can be either "finalized", "confirmed" or "processed".
-        :param sleep_seconds: The number of seconds to sleep when polling the signature status.
+        :param sleep_seconds: The initial number of seconds to sleep when polling the signature status.
         :param response_extra: Extra data for response, in dict format (will be added as key: value in response)
         :param timeout: Timeout in seconds to wait for confirmation
+        :param max_sleep_seconds: The sleep between polls grows exponentially (x1.5) up to this number of seconds.
         """
-        timeout = time.time() + timeout
+        deadline = time.monotonic() + timeout
+        commitment_rank = COMMITMENT_RANKS[commitment]
         resp = {}
         last_confirmation_amount = 0
         confirmed = False
-        response = DotDict(signature=tx_sig, confirmed=confirmed)
+        response = DotDict(signature=tx_sig, confirmed=confirmed, err=None)
         if response_extra:
             response.update(response_extra)
-        while time.time() < timeout:
-            resp = self.client.get_signature_statuses([tx_sig], search_transaction_history=True)
+        backoff = sleep_seconds
+        while time.monotonic() < deadline:
+            resp = self.read("get_signature_statuses", [tx_sig], search_transaction_history=True)
             maybe_rpc_error = resp.get("error")
             if maybe_rpc_error is not None:
                 logger.error(f"Unable to confirm transaction {tx_sig}. {maybe_rpc_error}")
                 break
             resp_value = resp["result"]["value"][0]
+            if resp_value is not None and resp_value["err"]:
+                logger.error(f"transaction {tx_sig} failed: {resp_value['err']}")
+                response.err = resp_value["err"]
+                break
             if resp_value is not None:
-                confirmation_status = resp_value["confirmationStatus"]
-                confirmation_rank = COMMITMENT_RANKS[confirmation_status]
-                commitment_rank = COMMITMENT_RANKS[commitment]
+                confirmation_rank = COMMITMENT_RANKS[resp_value["confirmationStatus"]]
                 if confirmation_rank >= commitment_rank:
                     logger.debug(f"transaction {tx_sig} confirmed (rank: {confirmation_rank})")
                     confirmed = True
@@ -239,12 +475,81 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
                 if last_confirmation_amount != confirmation_amount:
                     logger.info(f"transaction {tx_sig} confirmed by {confirmation_amount} validators")
                     last_confirmation_amount = confirmation_amount
-            time.sleep(sleep_seconds)
+                    # the transaction is making progress, keep polling at the initial rate
+                    backoff = sleep_seconds
+            time.sleep(backoff * random.uniform(0.7, 1.3))
+            backoff = min(backoff * 1.5, max_sleep_seconds)
         else:
             maybe_rpc_error = resp.get("error")
             logger.error(f"Unable to confirm transaction {tx_sig}. {maybe_rpc_error}")
         return response.update(confirmed=confirmed)
 
+    def confirm_transactions_bulk(
+        self,
+        signatures: List[str],
+        commitment: Commitment = Finalized,
+        timeout: int = 30,
+        sleep_seconds: float = 0.2,
+        max_sleep_seconds: float = 2.0,
+        pool_size: int = 8,
+    ) -> Dict[str, Dict]:
+        """Confirm multiple transactions, polling the statuses of up to 256 signatures per request.
+        Returns dict of signature: {"confirmed": bool, "err": error}, the error is set for transactions that failed.
+
+        :param signatures: The transaction signatures to confirm.
+        :param commitment: Bank state to query. It can be either "finalized", "confirmed" or "processed".
+        :param timeout: Timeout in seconds to wait for all the confirmations.
+        :param sleep_seconds: The initial number of seconds to sleep between polls.
+        :param max_sleep_seconds: The sleep between polls grows exponentially (x1.5) up to this number of seconds.
+        :param pool_size: Max number of status requests to send concurrently.
+        """
+
+        def get_statuses(chunk):
+            try:
+                return chunk, self.read("get_signature_statuses", chunk, search_transaction_history=True)
+            except Exception as ex:
+                # a failed request (network error, for example) leaves its chunk pending for the next poll
+                return chunk, {"error": f"{ex}"}
+
+        deadline = time.monotonic() + timeout
+        commitment_rank = COMMITMENT_RANKS[commitment]
+        statuses = {signature: DotDict(confirmed=False, err=None) for signature in signatures}
+        pending = list(statuses)
+        backoff = sleep_seconds
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            while pending and time.monotonic() < deadline:
+                still_pending = []
+                chunks = [
+                    pending[i : i + MAX_SIGNATURE_STATUSES] for i in range(0, len(pending), MAX_SIGNATURE_STATUSES)
+                ]
+                for chunk, resp in executor.map(get_statuses, chunks):
+                    maybe_rpc_error = resp.get("error")
+                    if maybe_rpc_error is not None:
+                        logger.error(f"Unable to get {len(chunk)} transactions statuses. {maybe_rpc_error}")
+                        still_pending.extend(chunk)
+                        continue
+                    for tx_sig, resp_value in zip(chunk, resp["result"]["value"]):
+                        if resp_value and resp_value["err"]:
+                            logger.warning(f"transaction {tx_sig} failed: {resp_value['err']}")
+                            statuses[tx_sig].err = resp_value["err"]
+                        elif resp_value and COMMITMENT_RANKS[resp_value["confirmationStatus"]] >= commitment_rank:
+                            logger.debug(f"transaction {tx_sig} confirmed ({resp_value['confirmationStatus']})")
+                            statuses[tx_sig].confirmed = True
+                        else:
+                            still_pending.append(tx_sig)
+                if len(still_pending) < len(pending):
+                    # transactions are being confirmed, keep polling at the initial rate
+                    backoff = sleep_seconds
+                else:
+                    backoff = min(backoff * 1.5, max_sleep_seconds)
+                pending = still_pending
+                if pending:
+                    logger.info(f"waiting for {len(pending)} transactions to be confirmed")
+                    time.sleep(backoff * random.uniform(0.7, 1.3))
+        if pending:
+            logger.error(f"Unable to confirm {len(pending)} transactions")
+        return statuses
+
     def bulk_status(self, csv_path: str):
         """Get transfer status for a given transfer csv file.
 
@@ -256,5 +561,5 @@ class BulkHandler:  # pylint: disable=too-many-instance-attributes
         if not in_process_file.exists():
             logger.error(f"missing in-process file: ({in_process_file})")
             return response.update(err="missing json file")
-        self.in_process = json.loads(in_process_file.read_text(encoding="utf-8"))
+        self.in_process = self.load_in_process(in_process_file)
         return self.sum_info(self.in_process)
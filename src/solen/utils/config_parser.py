@@ -1,18 +1,51 @@
 import re
 import logging
 import configparser
+from functools import lru_cache
 from configparser import _UNSET, NoSectionError
 
 from asyncit.dicts import DotDict
 
 logger = logging.getLogger(__name__)
 
+CAMEL_CASE_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@lru_cache(maxsize=1024)
+def camel_case_to_snake(name):
+    return CAMEL_CASE_PATTERN.sub("_", name).lower()
+
 
 class ConfigParser(configparser.ConfigParser):  # pylint: disable=too-many-ancestors
     def __init__(self, config_file=None):
         self.config_file = config_file
+        self._items_cache = {}
         super().__init__()
 
+    def read(self, filenames, encoding=None):
+        self._items_cache.clear()
+        return super().read(filenames, encoding)
+
+    def read_file(self, f, source=None):
+        self._items_cache.clear()
+        super().read_file(f, source)
+
+    def read_dict(self, dictionary, source="<dict>"):
+        self._items_cache.clear()
+        super().read_dict(dictionary, source)
+
+    def set(self, section, option, value=None):
+        self._items_cache.clear()
+        super().set(section, option, value)
+
+    def remove_option(self, section, option):
+        self._items_cache.clear()
+        return super().remove_option(section, option)
+
+    def remove_section(self, section):
+        self._items_cache.clear()
+        return super().remove_section(section)
+
     def options(self, section, include_defaults=True):  # pylint: disable=arguments-differ
         """Return a list of option names for the given section name.
 
@@ -47,9 +80,14 @@ class ConfigParser(configparser.ConfigParser):  # pylint: disable=too-many-ances
             `vars' argument, which must be a dictionary whose contents overrides
             any pre-existing defaults.
         :param include_defaults: The section DEFAULT is special. Add default values as values for the section.
+
+        The results are cached (unless vars are given) until the config is read or changed again.
         """
         if section is _UNSET:
             return super().items()
+        cache_key = (section, raw, include_defaults)
+        if not vars and cache_key in self._items_cache:
+            return list(self._items_cache[cache_key])
         if include_defaults:
             data = self._defaults.copy()
         else:
@@ -69,15 +107,16 @@ class ConfigParser(configparser.ConfigParser):  # pylint: disable=too-many-ances
         value_getter = lambda option: self._interpolation.before_get(self, section, option, data[option], data)
         if raw:
             value_getter = lambda option: data[option]
-        return [(option, value_getter(option)) for option in data.keys()]
+        items = [(option, value_getter(option)) for option in data.keys()]
+        if not vars:
+            self._items_cache[cache_key] = items
+        return list(items)
 
     def optionxform(self, optionstr):
         return self.camel_case_to_snake(optionstr)
 
     def camel_case_to_snake(self, name):
-        pattern = re.compile(r"(?<!^)(?=[A-Z])")
-        name = pattern.sub("_", name).lower()
-        return name
+        return camel_case_to_snake(name)
 
     def get_value(self, section, key, default=None):
         try:
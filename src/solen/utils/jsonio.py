@@ -0,0 +1,49 @@
+import os
+import json
+import mmap
+from typing import Dict, Union
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def json_loads(content: Union[str, bytes]):
+    """Deserialize json content, using orjson when available."""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
+def json_dumps(data) -> bytes:
+    """Serialize data to json utf-8 bytes, using orjson when available."""
+    return orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+
+
+def load_json(path: Path) -> Dict:
+    """Load the given json (or msgpack, by the file suffix) file.
+    The file is memory mapped, so it's parsed without copying its whole content into memory first.
+    """
+    if not path.stat().st_size or (path.suffix != ".msgpack" and not orjson):
+        return json_loads(path.read_bytes())
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+        if path.suffix == ".msgpack":
+            return msgpack.unpackb(view, raw=False)
+        return orjson.loads(view)
+
+
+def dump_json(path: Path, data: Dict):
+    """Write data to the given json (or msgpack, by the file suffix) file.
+    The data is written to a temporary file that replaces the file, so a killed run can't leave it half written.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    if path.suffix == ".msgpack":
+        tmp_path.write_bytes(msgpack.packb(data, use_bin_type=True))
+    else:
+        tmp_path.write_bytes(json_dumps(data))
+    os.replace(tmp_path, path)
@@ -0,0 +1,88 @@
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from solana.rpc.api import Client
+from solana.rpc.types import RPCMethod, RPCResponse
+from requests.adapters import HTTPAdapter
+from solana.exceptions import SolanaRpcException, handle_exceptions
+from urllib3.util.retry import Retry
+from solana.rpc.commitment import Commitment
+from solana.rpc.providers.http import HTTPProvider
+
+from .jsonio import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+# number of hosts (rpc, token list, arweave, ...) to keep pools for, and max open connections per host
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 256
+RETRY_STATUS_FORCELIST = [429, 502, 503, 504]
+
+session = None
+session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Get the shared HTTP session, keeping a pool of open connections to re-use across requests."""
+    global session  # pylint: disable=global-statement
+    if session is not None:
+        return session
+    with session_lock:
+        if session is None:
+            retry = Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=RETRY_STATUS_FORCELIST,
+                allowed_methods=None,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+            new_session = requests.Session()
+            new_session.mount("https://", adapter)
+            new_session.mount("http://", adapter)
+            session = new_session
+    return session
+
+
+class SessionHTTPProvider(HTTPProvider):
+    """HTTP provider that sends the rpc requests over the shared session instead of a new connection per request.
+    The requests and responses are (de)serialized with orjson when available.
+    """
+
+    def json_encode(self, obj: Dict[Any, Any], cls=None) -> bytes:
+        if cls is None:
+            try:
+                return json_dumps(obj)
+            except TypeError:
+                pass  # the friendly encoder explains which value can't be encoded
+        return super().json_encode(obj, cls=cls)
+
+    @handle_exceptions(SolanaRpcException, requests.exceptions.RequestException)
+    def make_request(self, method: RPCMethod, *params: Any) -> RPCResponse:
+        request_kwargs = self._before_request(method=method, params=params, is_async=False)
+        raw_response = get_session().post(**request_kwargs, timeout=self.timeout)
+        raw_response.raise_for_status()
+        return json_loads(raw_response.content)
+
+    def is_connected(self) -> bool:
+        try:
+            response = get_session().get(self.health_uri, timeout=self.timeout)
+            response.raise_for_status()
+        except (IOError, requests.HTTPError) as ex:
+            logger.error(f"health check failed with error: {ex}")
+            return False
+        return response.ok
+
+
+def create_client(endpoint: str, commitment: Optional[Commitment] = None, timeout: float = 10) -> Client:
+    """Create an rpc Client that uses the shared HTTP session.
+
+    :param endpoint: The rpc endpoint url.
+    :param commitment: Default bank state to query.
+    :param timeout: HTTP request timeout in seconds.
+    """
+    client = Client(endpoint, commitment=commitment, timeout=timeout)
+    client._provider = SessionHTTPProvider(endpoint, timeout=timeout)  # pylint: disable=protected-access
+    return client
@@ -1,3 +1,10 @@
-import pkg_resources
+try:
+    from importlib.metadata import version
+except ImportError:  # python 3.7
+    import pkg_resources
 
-__version__ = pkg_resources.require("solen")[0].version
+    def version(distribution_name):
+        return pkg_resources.require(distribution_name)[0].version
+
+
+__version__ = version("solen")
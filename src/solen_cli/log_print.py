@@ -39,3 +39,6 @@ class LogPrint:
         header_length = 40
         header_padding = "-"
         print(f"{header:{header_padding}^{header_length}}")
+
+
+log_print = LogPrint()
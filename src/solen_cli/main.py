@@ -2,17 +2,16 @@
 import logging
 
 import argh
-import pkg_resources
+
+from solen import __version__
 
 from .nft import update, accounts, bulk_update, bulk_update_status
 from .token import balance, transfer, bulk_transfer, bulk_transfer_status
-from .log_print import LogPrint
+from .log_print import log_print
 
 # from solen import Context, NFTClient, SOLClient, TokenClient
 
 
-log_print = LogPrint()
-
 loggerpy = logging.getLogger("solen")
 loggerpy.setLevel(logging.DEBUG)
 ch = logging.StreamHandler()
@@ -26,7 +25,7 @@ def version():
     """
     Current installed version
     """
-    log_print.info(pkg_resources.require("solen")[0].version)
+    log_print.info(__version__)
 
 
 def main():
@@ -1,22 +1,21 @@
 import argh
 
-from solen import NFTClient
+import solen
 
 from .table import dict_to_pt, dicts_to_pt
-from .log_print import LogPrint
-
-log_print = LogPrint()
+from .log_print import log_print
 
 
 @argh.arg("-e", "--env", help="Solana env (dev / main)")
 def accounts(env=None):
     """Display local wallet Token accounts"""
     log_print.header(f"get token balance (env: {env})")
-    nft_client = NFTClient(env)
-    account = nft_client.context.keypair.public_key
-    log_print.info(f"NFT accounts for {account}")
-    nft_accounts = nft_client.get_all_nft_accounts_by_owner()
-    print(dicts_to_pt(nft_accounts, align="l"))
+    with solen.Context(env) as context:
+        nft_client = solen.NFTClient(context=context)
+        account = nft_client.context.keypair.public_key
+        log_print.info(f"NFT accounts for {account}")
+        nft_accounts = nft_client.get_all_nft_accounts_by_owner()
+        print(dicts_to_pt(nft_accounts, align="l"))
 
 
 @argh.arg("mint_address", help="Mint address of NFT to modify")
@@ -28,9 +27,10 @@ def update(mint_address, env=None, **kwargs):
     """Update single NFT metadata"""
     log_print.header(f"Update NFT {mint_address} (env: {env})")
     update_data = dict(name=kwargs.get("name"), symbol=kwargs.get("symbol"), uri=kwargs.get("uri"))
-    nft_client = NFTClient(env)
-    update_response = nft_client.update_nft(mint_address, **update_data)
-    print(dict_to_pt(update_response, align="l"))
+    with solen.Context(env) as context:
+        nft_client = solen.NFTClient(context=context)
+        update_response = nft_client.update_nft(mint_address, **update_data)
+        print(dict_to_pt(update_response, align="l"))
 
 
 @argh.arg("csv", help="A csv file with wallet,amount to be transfer")
@@ -44,16 +44,22 @@ def update(mint_address, env=None, **kwargs):
     action="store_true",
     help="Run update also for action with signature but not finalized",
 )
-def bulk_update(csv, dry_run=False, env=None, skip_confirm=False, ignore_unfinalized_signature=False):
+@argh.arg("-p", "--pool-size", type=int, default=32, help="Max number of actions to run concurrently")
+def bulk_update(csv, dry_run=False, env=None, skip_confirm=False, ignore_unfinalized_signature=False, pool_size=32):
     """Update multiple NFTs metadata, based on the content of the given csv"""
     log_print.header(f"bulk update NFT (skip-confirmation: {skip_confirm}, dry-run={dry_run}, env: {env})")
-    nft_client = NFTClient(env)
-    log_print.info(f"running on {nft_client.context.rpc_endpoint}")
-    if nft_client.bulk_update_init(csv):
-        nft_client.bulk_update_nft(
-            csv, dry_run=dry_run, skip_confirm=skip_confirm, ignore_unfinalized_signature=ignore_unfinalized_signature
-        )
-        nft_client.bulk_confirm_transactions(csv)
+    with solen.Context(env) as context:
+        nft_client = solen.NFTClient(context=context)
+        log_print.info(f"running on {nft_client.context.rpc_endpoint}")
+        if nft_client.bulk_update_init(csv):
+            nft_client.bulk_update_nft(
+                csv,
+                dry_run=dry_run,
+                skip_confirm=skip_confirm,
+                ignore_unfinalized_signature=ignore_unfinalized_signature,
+                pool_size=pool_size,
+            )
+            nft_client.bulk_confirm_transactions(csv)
 
 
 @argh.arg("csv", help="A csv file with update actions data")
@@ -61,6 +67,7 @@ def bulk_update(csv, dry_run=False, env=None, skip_confirm=False, ignore_unfinal
 def bulk_update_status(csv, env="dev"):
     """Confirm that bulk update transaction signatures are finalized"""
     log_print.header("bulk transfer confirm")
-    nft_client = NFTClient(env)
-    status_response = nft_client.get_update_status(csv)
-    print(dict_to_pt(status_response, align="l"))
+    with solen.Context(env) as context:
+        nft_client = solen.NFTClient(context=context)
+        status_response = nft_client.get_update_status(csv)
+        print(dict_to_pt(status_response, align="l"))
@@ -1,14 +1,16 @@
 import logging
 import numbers
 from datetime import datetime
-from collections import OrderedDict
 
 from prettytable import PrettyTable
 
 logger = logging.getLogger(__name__)
 
+# the timestamp "T" and "Z" separators are shown as spaces
+TIMESTAMP_SEPARATORS = str.maketrans("TZ", "  ")
 
-def generate(cols, data, defaults=None, labels=None, align="c"):
+
+def generate(cols, data, defaults=None, labels=None, align="c", line_numbers=False):
     """
     Return a new PrettyTable instance representing the list.
 
@@ -33,6 +35,9 @@ def generate(cols, data, defaults=None, labels=None, align="c"):
         labels - A dictionary mapping a column name to a label that
                  will be used for the table header
 
+        line_numbers - If true, the values of the '#' column are the
+                       row numbers (starting from 1).
+
     """
 
     defaults = defaults or {}
@@ -56,10 +61,13 @@ def generate(cols, data, defaults=None, labels=None, align="c"):
 
     pt = PrettyTable([labels.get(col, col) for col in cols])
 
-    for item in data:
+    for line_number, item in enumerate(data, start=1):
         values_row = []
         for column in cols:
-            values_row.append(get_values_per_column(column, item))
+            if line_numbers and column == "#":
+                values_row.append(line_number)
+            else:
+                values_row.append(get_values_per_column(column, item))
         pt.add_row(values_row)
 
     pt.align = align
@@ -88,8 +96,7 @@ def dicts_to_pt(data, sort=None, align="c"):
     if not data:
         logger.info("missing data")
         return False
-    all_keys = sum([list(x.keys()) for x in data], [])  # get a list of all keys
-    columns = list(OrderedDict.fromkeys(all_keys))  # remove duplicates, uses OrderedDict to keep the order of columns
+    columns = list(dict.fromkeys(key for x in data for key in x))  # all the keys, in order and without duplicates
     return get_data_table(columns, data, sortby=sort, align=align)
 
 
@@ -105,12 +112,8 @@ def get_data_table(
         if "#" in columns:
             columns.remove("#")
         columns.insert(0, "#")
-        line_number = 1
-        for item in items:
-            item["#"] = line_number
-            line_number += 1
 
-    pt = generate(columns, data=items, defaults=defaults, labels=labels, align=align)
+    pt = generate(columns, data=items, defaults=defaults, labels=labels, align=align, line_numbers=line_numbers)
     if max_width:
         pt.max_width = max_width
     pt.sortby = sortby
@@ -121,7 +124,7 @@ def get_data_table(
 def get_timestamp(data):
     try:
         datetime.strptime(data[:10], "%Y-%m-%d")
-        return data.replace("T", " ").replace("Z", " ")
+        return data.translate(TIMESTAMP_SEPARATORS)
     except ValueError:
         # not a timestamp
         return None
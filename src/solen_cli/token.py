@@ -1,28 +1,26 @@
 import argh
 
-from solen import Context, TokenClient
+import solen
 
 from .table import dict_to_pt
-from .log_print import LogPrint
-
-log_print = LogPrint()
+from .log_print import log_print
 
 
 @argh.arg("-e", "--env", help="Solana env (dev / main)")
 def balance(env=None):
     """Display local wallet balance of SOL & Token"""
     log_print.header(f"get token balance (env: {env})")
-    context = Context(env)
-    wallet = context.keypair.public_key
-    token_client = TokenClient(env, context=context)
-    registered_info = token_client.get_registered_info()
-    token_symbol = registered_info[0].symbol if registered_info else "N/A"
-    balance_info = {
-        "account address": wallet,
-        "token mint": token_client.token_mint,
-        "token symbol": token_symbol,
-        "amount": token_client.balance(),
-    }
+    with solen.Context(env) as context:
+        wallet = context.keypair.public_key
+        token_client = solen.TokenClient(context=context)
+        registered_info = token_client.get_registered_info()
+        token_symbol = registered_info[0].symbol if registered_info else "N/A"
+        balance_info = {
+            "account address": wallet,
+            "token mint": token_client.token_mint,
+            "token symbol": token_symbol,
+            "amount": token_client.balance(),
+        }
     print(dict_to_pt(balance_info, align="l"))
 
 
@@ -32,8 +30,9 @@ def balance(env=None):
 def transfer(wallet, amount, env=None):
     """Transfer token from local wallet ro recipient"""
     log_print.header(f"transfer token (env: {env})")
-    token_client = TokenClient(env)
-    token_client.transfer_token(wallet, float(amount))
+    with solen.Context(env) as context:
+        token_client = solen.TokenClient(context=context)
+        token_client.transfer_token(wallet, float(amount))
 
 
 @argh.arg("csv", help="A csv file with wallet,amount to be transfer")
@@ -47,16 +46,32 @@ def transfer(wallet, amount, env=None):
     action="store_true",
     help="Run transfer also for action with signature but not finalized",
 )
-def bulk_transfer(csv, dry_run=False, env=None, skip_confirm=False, ignore_unfinalized_signature=False):
+@argh.arg("-p", "--pool-size", type=int, default=32, help="Max number of actions to run concurrently")
+@argh.arg("--skip-preflight", default=False, action="store_true", help="Send transactions without simulating them")
+def bulk_transfer(
+    csv,
+    dry_run=False,
+    env=None,
+    skip_confirm=False,
+    ignore_unfinalized_signature=False,
+    pool_size=32,
+    skip_preflight=False,
+):
     """Transfer token to multiple addresses, based on the content of the given csv"""
     log_print.header(f"bulk transfer token (skip-confirmation: {skip_confirm}, dry-run: {dry_run}, env: {env})")
-    token_client = TokenClient(env)
-    log_print.info(f"running on {token_client.context.rpc_endpoint}")
-    if token_client.bulk_transfer_token_init(csv):
-        token_client.bulk_transfer_token(
-            csv, dry_run=dry_run, skip_confirm=skip_confirm, ignore_unfinalized_signature=ignore_unfinalized_signature
-        )
-        token_client.bulk_confirm_transactions(csv)
+    with solen.Context(env) as context:
+        token_client = solen.TokenClient(context=context)
+        log_print.info(f"running on {token_client.context.rpc_endpoint}")
+        if token_client.bulk_transfer_token_init(csv):
+            token_client.bulk_transfer_token(
+                csv,
+                dry_run=dry_run,
+                skip_confirm=skip_confirm,
+                ignore_unfinalized_signature=ignore_unfinalized_signature,
+                pool_size=pool_size,
+                skip_preflight=skip_preflight,
+            )
+            token_client.bulk_confirm_transactions(csv)
 
 
 @argh.arg("csv", help="A csv file with wallet,amount to be transfer")
@@ -64,6 +79,7 @@ def bulk_transfer(csv, dry_run=False, env=None, skip_confirm=False, ignore_unfin
 def bulk_transfer_status(csv, env="dev"):
     """Confirm that transfer amount transaction signatures are finalized"""
     log_print.header("bulk transfer confirm")
-    token_client = TokenClient(env)
-    status_response = token_client.get_transfer_status(csv)
-    print(dict_to_pt(status_response, align="l"))
+    with solen.Context(env) as context:
+        token_client = solen.TokenClient(context=context)
+        status_response = token_client.get_transfer_status(csv)
+        print(dict_to_pt(status_response, align="l"))
@@ -0,0 +1,99 @@
+from solen.utils import bulk_handler as bulk_handler_module
+from solen.utils.jsonio import dump_json, load_json
+from solen.utils.bulk_handler import BulkHandler, get_journal_path, load_in_process_file, save_in_process_file
+
+FINALIZED_STATUS = {"err": None, "confirmationStatus": "finalized", "confirmations": None}
+
+
+def get_bulk_handler(tmp_path, **kwargs):
+    return BulkHandler(None, "dev", tmp_path, None, None, "transfer", ["dest", "amount"], **kwargs)
+
+
+def test_journal_replay_skips_truncated_last_line(tmp_path):
+    in_process_file = tmp_path.joinpath("bulk.json")
+    dump_json(in_process_file, {"0": {"signature": ""}, "1": {"signature": ""}})
+    get_journal_path(in_process_file).write_bytes(b'{"index": "0", "signature": "sig0"}\n{"index": "1", "signa')
+    in_process = load_in_process_file(in_process_file)
+    assert in_process == {"0": {"signature": "sig0"}, "1": {"signature": ""}}
+
+
+def test_compact_then_load(tmp_path):
+    in_process_file = tmp_path.joinpath("bulk.json")
+    dump_json(in_process_file, {"0": {"signature": ""}})
+    journal_file = get_journal_path(in_process_file)
+    journal_file.write_bytes(b'{"index": "0", "signature": "sig0"}\n')
+    save_in_process_file(in_process_file, load_in_process_file(in_process_file), changed=False)
+    assert not journal_file.exists()
+    assert load_json(in_process_file) == {"0": {"signature": "sig0"}}
+    assert load_in_process_file(in_process_file) == {"0": {"signature": "sig0"}}
+
+
+def test_journal_replay_of_plain_values(tmp_path):
+    in_process_file = tmp_path.joinpath("uploads.json")
+    dump_json(in_process_file, {"0": "url0"})
+    get_journal_path(in_process_file).write_bytes(b'{"key": "1", "value": "url1"}\n')
+    assert load_in_process_file(in_process_file) == {"0": "url0", "1": "url1"}
+
+
+def test_process_transfer_csv(tmp_path):
+    csv_path = tmp_path.joinpath("transfer.csv")
+    csv_path.write_bytes(b'\xef\xbb\xbfamount,dest\r\n"1,000.5",wallet1\r\n\r\n2,wallet2\r\n,\r\n')
+    in_process = get_bulk_handler(tmp_path).process_transfer_csv(str(csv_path))
+    assert in_process == {
+        "0": {"dest": "wallet1", "amount": "1000.5", "finalized": False, "signature": "", "error": ""},
+        "1": {"dest": "wallet2", "amount": "2", "finalized": False, "signature": "", "error": ""},
+    }
+
+
+def test_confirm_bulk_keeps_failed_requests_pending(tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_handler_module.time, "sleep", lambda seconds: None)
+    calls = []
+
+    def read(method, signatures, **kwargs):
+        calls.append(method)
+        if len(calls) == 1:
+            raise ConnectionError("connection reset")
+        return {"result": {"value": [FINALIZED_STATUS for _ in signatures]}}
+
+    statuses = get_bulk_handler(tmp_path, read_callback=read).confirm_transactions_bulk(["sig0", "sig1"])
+    assert statuses == {"sig0": {"confirmed": True, "err": None}, "sig1": {"confirmed": True, "err": None}}
+    assert len(calls) == 2
+
+
+def test_bulk_confirm_polls_when_websocket_fails(tmp_path):
+    dump_json(tmp_path.joinpath("dev_transfer.json"), {"0": {"signature": "sig0"}, "1": {"signature": "sig1"}})
+    polled = []
+
+    def read(method, signatures, **kwargs):
+        polled.extend(signatures)
+        return {"result": {"value": [FINALIZED_STATUS for _ in signatures]}}
+
+    async def await_confirmations_ws(signatures, timeout):
+        raise ConnectionError("websocket closed")
+
+    bulk_handler = get_bulk_handler(tmp_path, ws_endpoint="ws://localhost", read_callback=read)
+    bulk_handler._await_confirmations_ws = await_confirmations_ws
+    bulk_handler.bulk_confirm("transfer.csv")
+    assert polled == ["sig0", "sig1"]
+    assert load_json(tmp_path.joinpath("dev_transfer.json")) == {
+        "0": {"signature": "sig0", "finalized": True},
+        "1": {"signature": "sig1", "finalized": True},
+    }
+
+
+def test_bulk_confirm_polls_signatures_missed_by_websocket(tmp_path):
+    dump_json(tmp_path.joinpath("dev_transfer.json"), {"0": {"signature": "sig0"}, "1": {"signature": "sig1"}})
+    polled = []
+
+    def read(method, signatures, **kwargs):
+        polled.extend(signatures)
+        return {"result": {"value": [FINALIZED_STATUS for _ in signatures]}}
+
+    async def await_confirmations_ws(signatures, timeout):
+        return {"sig0": None}
+
+    bulk_handler = get_bulk_handler(tmp_path, ws_endpoint="ws://localhost", read_callback=read)
+    bulk_handler._await_confirmations_ws = await_confirmations_ws
+    bulk_handler.bulk_confirm("transfer.csv")
+    assert polled == ["sig1"]
+    assert all(item["finalized"] for item in load_json(tmp_path.joinpath("dev_transfer.json")).values())
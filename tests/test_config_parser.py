@@ -0,0 +1,21 @@
+from solen.utils.config_parser import ConfigParser
+
+
+def get_config():
+    config = ConfigParser()
+    config.read_dict({"solana": {"dev_keypair": "~/dev.json", "main_keypair": "~/main.json"}})
+    return config
+
+
+def test_set_invalidates_items_cache():
+    config = get_config()
+    assert dict(config.items("solana"))["dev_keypair"] == "~/dev.json"
+    config.set("solana", "dev_keypair", "~/other.json")
+    assert dict(config.items("solana"))["dev_keypair"] == "~/other.json"
+
+
+def test_remove_option_invalidates_items_cache():
+    config = get_config()
+    assert "main_keypair" in dict(config.items("solana"))
+    config.remove_option("solana", "main_keypair")
+    assert "main_keypair" not in dict(config.items("solana"))
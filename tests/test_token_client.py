@@ -0,0 +1,189 @@
+import base64
+import struct
+from types import SimpleNamespace
+
+import pytest
+import spl.token.instructions as spl_token
+from solana.keypair import Keypair
+from solana.rpc.core import RPCException
+from solana.publickey import PublicKey
+from solana.transaction import Transaction
+from spl.token.constants import TOKEN_PROGRAM_ID
+from spl.token.instructions import TransferCheckedParams, transfer_checked
+
+from solen import token_client as token_client_module
+from solen.token_client import TokenClient
+from solen.utils.jsonio import dump_json
+
+TOKEN_MINT = "EchesyfXePKdLtoiZSL8pBe8Myagyy8ZRqsACNCFGnvp"
+TOKEN_DECIMALS = 6
+BLOCKHASHES = [
+    "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM",
+    "8opHzTAnfzRpPEx21XtnrVTX28YQuCpAjcn1PczScKh",
+    "CjJWxPeTEc7Bx2HHBZoPSZxXPKCC4xvi9xSp3BaHj5j8",
+]
+
+
+class FakeClient:
+    def __init__(self, blockhashes=None):
+        self.blockhashes = list(blockhashes or BLOCKHASHES)
+        self.blockhash_calls = 0
+        self.program_accounts_data = []
+        self.program_accounts_kwargs = None
+
+    def get_recent_blockhash(self, commitment=None):
+        blockhash = self.blockhashes[min(self.blockhash_calls, len(self.blockhashes) - 1)]
+        self.blockhash_calls += 1
+        return {"result": {"value": {"blockhash": blockhash}}}
+
+    def get_program_accounts(self, **kwargs):
+        self.program_accounts_kwargs = kwargs
+        return {"result": [{"account": {"data": [data, "base64"]}} for data in self.program_accounts_data]}
+
+
+def get_token_client(tmp_path, client=None):
+    dump_json(tmp_path.joinpath("dev_mint_decimals.json"), {TOKEN_MINT: TOKEN_DECIMALS})
+    context = SimpleNamespace(
+        env="dev",
+        client=client or FakeClient(),
+        keypair=Keypair(),
+        config_folder=tmp_path,
+        ws_endpoint=None,
+        race_read=None,
+        configured_token_mint=TOKEN_MINT,
+        priority_fee=0,
+    )
+    return TokenClient(context=context)
+
+
+def get_transaction(token_client, dest, amount_lamport):
+    return Transaction().add(token_client._get_transfer_instruction(dest, amount_lamport))
+
+
+def test_transfer_instruction_matches_transfer_checked(tmp_path):
+    token_client = get_token_client(tmp_path)
+    dest = Keypair().public_key
+    instruction = token_client._get_transfer_instruction(dest, 1_500_000)
+    expected = transfer_checked(
+        TransferCheckedParams(
+            program_id=TOKEN_PROGRAM_ID,
+            source=token_client.source_associated_address,
+            mint=token_client.token_mint_public_key,
+            dest=dest,
+            owner=token_client.keypair.public_key,
+            amount=1_500_000,
+            decimals=TOKEN_DECIMALS,
+            signers=[],
+        )
+    )
+    assert instruction == expected
+    assert instruction.data == struct.pack("<BQB", 12, 1_500_000, TOKEN_DECIMALS)
+
+
+def test_blockhash_is_reused(tmp_path):
+    token_client = get_token_client(tmp_path)
+    first = get_transaction(token_client, Keypair().public_key, 1)
+    second = get_transaction(token_client, Keypair().public_key, 1)
+    assert token_client.sign_transaction(first) != token_client.sign_transaction(second)
+    assert first.recent_blockhash == second.recent_blockhash == BLOCKHASHES[0]
+    assert token_client.client.blockhash_calls == 1
+
+
+def test_identical_transaction_gets_newer_blockhash(tmp_path, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(token_client_module.time, "sleep", sleeps.append)
+    client = FakeClient([BLOCKHASHES[0], BLOCKHASHES[0], BLOCKHASHES[1]])
+    token_client = get_token_client(tmp_path, client)
+    dest = Keypair().public_key
+    first = get_transaction(token_client, dest, 1)
+    second = get_transaction(token_client, dest, 1)
+    assert token_client.sign_transaction(first) != token_client.sign_transaction(second)
+    assert (first.recent_blockhash, second.recent_blockhash) == (BLOCKHASHES[0], BLOCKHASHES[1])
+    assert len(sleeps) == 1
+
+
+def test_duplicate_detected_when_blockhash_is_fetched_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_client_module.time, "sleep", lambda seconds: None)
+    token_client = get_token_client(tmp_path, FakeClient([BLOCKHASHES[0], BLOCKHASHES[1]]))
+    dest = Keypair().public_key
+    token_client.sign_transaction(get_transaction(token_client, dest, 1))
+    # an expired blockhash is fetched again, the signatures made with it are still known
+    token_client.recent_blockhash_time = 0
+    token_client.client.blockhash_calls = 0
+    again = get_transaction(token_client, dest, 1)
+    token_client.sign_transaction(again)
+    assert again.recent_blockhash == BLOCKHASHES[1]
+
+
+def test_no_newer_blockhash_raises_rpc_exception(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_client_module.time, "sleep", lambda seconds: None)
+    token_client = get_token_client(tmp_path, FakeClient([BLOCKHASHES[0]]))
+    dest = Keypair().public_key
+    token_client.sign_transaction(get_transaction(token_client, dest, 1))
+    with pytest.raises(RPCException):
+        token_client.sign_transaction(get_transaction(token_client, dest, 1))
+
+
+def test_rejected_blockhash_is_not_reused(tmp_path):
+    token_client = get_token_client(tmp_path)
+    token_client.sign_transaction(get_transaction(token_client, Keypair().public_key, 1))
+    token_client._invalidate_recent_blockhash(BLOCKHASHES[1])
+    assert token_client.recent_blockhash == BLOCKHASHES[0]
+    token_client._invalidate_recent_blockhash(BLOCKHASHES[0])
+    transaction = get_transaction(token_client, Keypair().public_key, 1)
+    token_client.sign_transaction(transaction)
+    assert transaction.recent_blockhash == BLOCKHASHES[1]
+
+
+def test_destination_read_error_fails_the_transfer(tmp_path):
+    token_client = get_token_client(tmp_path)
+
+    def race_read(method, *args, **kwargs):
+        raise ConnectionError("connection reset")
+
+    token_client.context.race_read = race_read
+    response = token_client.transfer_token(str(Keypair().public_key), 1)
+    assert not response.ok
+    assert response.err == "connection reset"
+    assert not token_client.resolved_destinations
+
+
+def test_balance_many_reports_invalid_owner(tmp_path):
+    token_client = get_token_client(tmp_path)
+    owner = str(Keypair().public_key)
+    amount_data = base64.b64encode(struct.pack("<Q", 2_500_000)).decode()
+    token_client.context.race_read = lambda method, addresses, **kwargs: {
+        "result": {"value": [{"data": [amount_data, "base64"]} for _ in addresses]}
+    }
+    assert token_client.balance_many([owner, "not-an-address"]) == {owner: 2.5, "not-an-address": None}
+
+
+def test_compute_budget_instructions_encoding():
+    limit, price = TokenClient._get_compute_budget_instructions(60_000, 25_000)
+    assert limit.program_id == price.program_id == PublicKey("ComputeBudget111111111111111111111111111111")
+    assert limit.keys == price.keys == []
+    assert limit.data == bytes([2]) + (60_000).to_bytes(4, "little")
+    assert price.data == bytes([3]) + (25_000).to_bytes(8, "little")
+
+
+def test_create_associated_account_instruction_is_idempotent(tmp_path):
+    token_client = get_token_client(tmp_path)
+    owner = Keypair().public_key
+    instruction = token_client._get_create_associated_account_instruction(owner)
+    create = spl_token.create_associated_token_account(
+        payer=token_client.keypair.public_key, owner=owner, mint=token_client.token_mint_public_key
+    )
+    assert instruction.data == bytes([1])
+    assert (instruction.program_id, instruction.keys) == (create.program_id, create.keys)
+    assert instruction.keys[1].pubkey == token_client.get_associated_address(str(owner))
+
+
+def test_snapshot_holders_decodes_owner_and_amount_slice(tmp_path):
+    token_client = get_token_client(tmp_path)
+    owners = [Keypair().public_key, Keypair().public_key]
+    slices = [bytes(owners[0]) + struct.pack("<Q", amount) for amount in (1_000_000, 500_000)]
+    slices.append(bytes(owners[1]) + struct.pack("<Q", 3_000_000))
+    token_client.client.program_accounts_data = [base64.b64encode(data).decode() for data in slices]
+    assert token_client.snapshot_holders() == [(str(owners[1]), 3.0), (str(owners[0]), 1.5)]
+    data_slice = token_client.client.program_accounts_kwargs["data_slice"]
+    assert (data_slice.offset, data_slice.length) == (32, 40)